@@ -6,7 +6,9 @@ from PyInstaller.utils.hooks import collect_data_files
 extra_datas = [
     ('pdf_generator_reportlab.py', '.'),
     ('validation.py', '.'),
-    ('security.py', '.')
+    ('security.py', '.'),
+    ('form_fields.py', '.'),
+    ('styles.qss', '.')
 ]
 
 a = Analysis(
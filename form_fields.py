@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Form Fields for Magnus Client Intake Form
+Field names, value formatters and the Word draft layout shared by the
+form window and the document generator
+"""
+
+import re
+from functools import partial
+
+# Whole-dollar amounts, optionally negative; anything else is shown as typed
+WHOLE_DOLLARS_PATTERN = re.compile(r'-?\d+')
+
+NOT_PROVIDED = "[Not provided]"
+
+
+def format_money(value):
+    """Format a whole-dollar amount, passing other text through"""
+    if not value:
+        return NOT_PROVIDED
+    text = str(value)
+    return f"${int(text):,}" if WHOLE_DOLLARS_PATTERN.fullmatch(text) else text
+
+
+def format_percent(value):
+    """Format a percentage, treating zero and blank values as not provided"""
+    return f"{value}%" if value else NOT_PROVIDED
+
+
+def format_yes_no(value):
+    """Format a check box as Yes/No"""
+    return "Yes" if value else "No"
+
+
+# Field name slugs: "Annuities (Fixed)" -> "annuities_fixed"
+SLUG_TABLE = str.maketrans({" ": "_", "(": None, ")": None})
+
+
+def field_slug(name: str) -> str:
+    """Turn a display name into the slug used in field names"""
+    return name.lower().translate(SLUG_TABLE)
+
+
+# Field names are built here once; the form pages, the review and both documents reuse them
+# Asset breakdown: (display name, field name)
+ASSET_BREAKDOWN_FIELDS = tuple((name, f"asset_breakdown_{field_slug(name)}") for name in (
+    "Stocks", "Bonds", "Mutual Funds", "ETFs", "UITs",
+    "Annuities (Fixed)", "Annuities (Variable)", "Options",
+    "Commodities", "Alternative Investments", "Limited Partnerships",
+    "Variable Contracts", "Short-Term", "Other"
+))
+# Investment experience: (display name, year field name, level field name)
+ASSET_EXPERIENCE_FIELDS = tuple(
+    (name, f"asset_experience_{field_slug(name)}_year", f"asset_experience_{field_slug(name)}_level")
+    for name in (
+        "Stocks", "Bonds", "Mutual Funds", "UITs",
+        "Annuities (Fixed)", "Annuities (Variable)", "Options",
+        "Commodities", "Alternative Investments", "Limited Partnerships",
+        "Variable Contracts"
+    )
+)
+# Investment purpose check boxes and ranked objectives: (display name, field name)
+INVESTMENT_PURPOSE_FIELDS = tuple((name, f"investment_purpose_{field_slug(name)}") for name in (
+    "Income", "Growth and Income", "Capital Appreciation", "Speculation"
+))
+INVESTMENT_OBJECTIVE_FIELDS = tuple((name, f"investment_objective_{field_slug(name)}") for name in (
+    "Trading Profits", "Speculation", "Capital Appreciation",
+    "Income", "Preservation of Capital"
+))
+# The purpose summary when every box is checked, joined once
+ALL_INVESTMENT_PURPOSES = ", ".join(name for name, _ in INVESTMENT_PURPOSE_FIELDS)
+
+
+def investment_purpose_text(data):
+    """Join the checked investment purposes, or None when none are checked"""
+    purposes = [purpose for purpose, field_name in INVESTMENT_PURPOSE_FIELDS if data.get(field_name)]
+    if len(purposes) == len(INVESTMENT_PURPOSE_FIELDS):
+        return ALL_INVESTMENT_PURPOSES
+    return ", ".join(purposes) or None
+
+
+def investment_objective_text(data):
+    """One "objective: rank" line per ranked objective, or None"""
+    return "\n".join(
+        f"{objective}: {data[field_name]}"
+        for objective, field_name in INVESTMENT_OBJECTIVE_FIELDS if data.get(field_name)
+    ) or None
+
+
+# Word draft layout
+def add_draft_rows(doc, rows, data, indent=""):
+    """Write "label: value" paragraphs; callable rows write their own content"""
+    for row in rows:
+        if callable(row):
+            row(doc, data)
+            continue
+        label, field_name, formatter = row
+        value = data.get(field_name)
+        if formatter is not None:
+            value = formatter(value)
+        doc.add_paragraph(f"{indent}{label}: {NOT_PROVIDED if value is None or value == '' else value}")
+
+
+def add_draft_investment_choices(doc, data):
+    """Write the checked investment purposes and the ranked objectives"""
+    doc.add_paragraph("Investment Purpose:")
+    doc.add_paragraph(investment_purpose_text(data) or NOT_PROVIDED)
+    doc.add_paragraph("Investment Objectives (Ranked 1-5):")
+    for objective, field_name in INVESTMENT_OBJECTIVE_FIELDS:
+        rank = data.get(field_name)
+        if rank:
+            doc.add_paragraph(f"  {objective}: {rank}")
+
+
+def add_draft_people(key, title, rows, doc, data):
+    """Write one numbered block per dependent or beneficiary"""
+    for i, person in enumerate(data.get(key) or (), 1):
+        doc.add_paragraph(f"{title} {i}:")
+        add_draft_rows(doc, rows, person, "  ")
+
+
+def add_draft_experience(doc, data):
+    """Write the year started and level for each investment type"""
+    for exp_type, year_field, level_field in ASSET_EXPERIENCE_FIELDS:
+        doc.add_paragraph(f"{exp_type}:")
+        add_draft_rows(doc, (("Year Started", year_field, None),
+                             ("Experience Level", level_field, None)), data, "  ")
+
+
+# Rows are (label, field name, formatter or None) or callables(doc, data)
+DEPENDENT_DRAFT_ROWS = (
+    ("Name", "name", None),
+    ("Date of Birth", "dob", None),
+    ("Relationship", "relationship", None),
+)
+BENEFICIARY_DRAFT_ROWS = DEPENDENT_DRAFT_ROWS + (("Percentage", "percentage", format_percent),)
+
+
+def draft_section_has_data(rows, data):
+    """Whether any "label: value" row of a section has a value"""
+    return any(data.get(row[1]) for row in rows if not callable(row))
+
+
+# Draft sections: (heading, shown when the predicate is true or None,
+# skipped when all its rows are empty, rows)
+DRAFT_SECTIONS = (
+    ("Personal Information", None, False, (
+        ("Full Name", "full_name", None),
+        ("Date of Birth", "dob", None),
+        ("Social Security Number", "ssn", None),
+        ("Citizenship", "citizenship", None),
+        ("Marital Status", "marital_status", None),
+    )),
+    ("Contact Information", None, False, (
+        ("Residential Address", "residential_address", None),
+        ("Email", "email", None),
+        ("Home Phone", "home_phone", None),
+        ("Mobile Phone", "mobile_phone", None),
+        ("Work Phone", "work_phone", None),
+    )),
+    ("Employment Information", None, False, (
+        ("Employment Status", "employment_status", None),
+        ("Employer Name", "employer_name", None),
+        ("Occupation", "occupation", None),
+        ("Years Employed", "years_employed", None),
+        ("Annual Income", "annual_income", format_money),
+    )),
+    ("Retirement Information", lambda data: data.get("employment_status") == "Retired", True, (
+        ("Former Employer", "former_employer", None),
+        ("Source of Income", "income_source", None),
+    )),
+    ("Financial Information", None, False, (
+        ("Education Status", "education_status", None),
+        ("Estimated Tax Bracket", "tax_bracket", None),
+        ("Investment Risk Tolerance", "risk_tolerance", None),
+        add_draft_investment_choices,
+        ("Net Worth", "net_worth", format_money),
+        ("Liquid Net Worth", "liquid_net_worth", format_money),
+        ("Assets Held Away", "assets_held_away", format_money),
+    )),
+    ("Spouse Information", lambda data: not data.get("spouse_applicable"), True, (
+        ("Full Name", "spouse_full_name", None),
+        ("Date of Birth", "spouse_dob", None),
+        ("Social Security Number", "spouse_ssn", None),
+        ("Employment Status", "spouse_employment_status", None),
+        ("Employer Name", "spouse_employer_name", None),
+        ("Occupation", "spouse_occupation", None),
+    )),
+    ("Dependents", lambda data: data.get("dependents"), False, (
+        partial(add_draft_people, "dependents", "Dependent", DEPENDENT_DRAFT_ROWS),
+    )),
+    ("Beneficiaries", lambda data: data.get("beneficiaries"), False, (
+        partial(add_draft_people, "beneficiaries", "Beneficiary", BENEFICIARY_DRAFT_ROWS),
+    )),
+    ("Asset Breakdown", None, True, tuple(
+        (asset_type, field_name, format_percent) for asset_type, field_name in ASSET_BREAKDOWN_FIELDS
+    )),
+    ("Investment Experience", lambda data: any(
+        data.get(year_field) or data.get(level_field) for _, year_field, level_field in ASSET_EXPERIENCE_FIELDS
+    ), False, (add_draft_experience,)),
+    ("Outside Broker Information", lambda data: data.get("has_outside_broker"), True, (
+        ("Broker Firm Name", "outside_firm_name", None),
+        ("Account Type", "outside_broker_account_type", None),
+        ("Account Number", "outside_broker_account_number", None),
+        ("Liquid Amount", "outside_liquid_amount", format_money),
+    )),
+    ("Trusted Contact Information", None, True, (
+        ("Full Name", "trusted_full_name", None),
+        ("Relationship", "trusted_relationship", None),
+        ("Phone Number", "trusted_phone", None),
+        ("Email Address", "trusted_email", None),
+    )),
+    ("Regulatory Consent", None, False, (
+        ("Electronic Delivery Consent", "electronic_regulatory_yes", format_yes_no),
+    )),
+)
+
+
+def add_draft_sections(doc, form_data):
+    """Write every shown section of DRAFT_SECTIONS to a Word document"""
+    for heading, show_if, skip_if_empty, rows in DRAFT_SECTIONS:
+        if show_if is not None and not show_if(form_data):
+            continue
+        if skip_if_empty and not draft_section_has_data(rows, form_data):
+            continue
+        doc.add_heading(heading, level=1)
+        add_draft_rows(doc, rows, form_data)
+        doc.add_paragraph()
@@ -7,101 +7,593 @@ security features, and PDF generation capabilities.
 
 import sys
 import os
-import json
 import tempfile
+import copy
+from io import BytesIO
 from datetime import datetime
+from functools import partial
 from typing import Dict, Any, List
 
+try:
+    import orjson
+except ImportError:
+    import json
+    orjson = None  # Fall back to the standard json module
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QLineEdit, QPushButton, QStackedWidget, QFrame, 
-    QComboBox, QDateEdit, QTextEdit, QCheckBox, QRadioButton,
+    QComboBox, QDateEdit, QTextEdit, QPlainTextEdit, QCheckBox, QRadioButton,
     QButtonGroup, QSpinBox, QGroupBox, QScrollArea, QMessageBox,
-    QProgressBar, QFileDialog, 
+    QProgressBar, QFileDialog, QFormLayout, QTableView, QHeaderView,
+    QAbstractItemView, QStyledItemDelegate,
+)
+from PyQt6.QtCore import (
+    Qt, QDate, QRegularExpression, pyqtSignal,
+    QAbstractTableModel, QModelIndex, QSignalBlocker,
+    QObject, QRunnable, QThreadPool,
 )
-import traceback
-from PyQt6.QtCore import Qt, QDate, QTimer, pyqtSignal
-from PyQt6.QtGui import QFont, QPixmap, QIcon
-import docx
-import subprocess
-import platform
-from docx import Document
-from docx.shared import Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.shared import Inches
+from PyQt6.QtGui import QFont, QPixmap, QIcon, QRegularExpressionValidator, QPalette, QColor
 
 # Import custom modules
+# python-docx and the PDF generator are imported where they are used so
+# they do not slow down startup
 from validation import form_validator
 from security import DataSecurity
-from pdf_generator_reportlab import generate_pdf_from_data
+from form_fields import (
+    NOT_PROVIDED, ASSET_BREAKDOWN_FIELDS, ASSET_EXPERIENCE_FIELDS,
+    INVESTMENT_PURPOSE_FIELDS, INVESTMENT_OBJECTIVE_FIELDS,
+    investment_purpose_text, investment_objective_text, add_draft_sections,
+)
+
+# Application stylesheet, loaded once at startup
+STYLESHEET_FILE = "styles.qss"
+# Default text colour, set through the palette rather than a QLabel rule
+TEXT_COLOR = "#2c3e50"
+
+# Location of a draft left by earlier versions that auto-saved
+AUTOSAVE_PATH = os.path.join(tempfile.gettempdir(), "magnus_form_autosave.json")
+
+# Widget classes whose named instances are form fields
+INPUT_WIDGET_TYPES = (QLineEdit, QComboBox, QDateEdit, QTextEdit, QSpinBox, QCheckBox, QRadioButton)
+
+# Date format used in form_data, the review and the generated documents
+DATE_FORMAT = "MM/dd/yyyy"
+
+
+def parse_date(text):
+    """Parse MM/dd/yyyy text without Qt's format-string parser"""
+    try:
+        month, day, year = map(int, str(text).split("/"))
+    except ValueError:
+        return QDate()
+    return QDate(year, month, day)
+
+
+def lookup_widget_class(table, widget):
+    """Find a widget's entry in a class-keyed table, falling back to its base classes"""
+    for widget_class in type(widget).__mro__:
+        entry = table.get(widget_class)
+        if entry is not None:
+            return entry
+    return None
+
+
+# How collect_form_data reads each kind of field, resolved once per widget
+FIELD_GETTERS = {
+    QLineEdit: QLineEdit.text,
+    QComboBox: QComboBox.currentText,
+    QDateEdit: lambda widget: widget.date().toString(DATE_FORMAT),
+    QTextEdit: QTextEdit.toPlainText,
+    QSpinBox: QSpinBox.value,
+    QCheckBox: QCheckBox.isChecked,
+    QRadioButton: QRadioButton.isChecked,
+}
+
+
+def field_getter(widget):
+    """Return the function that reads a field widget's value"""
+    return lookup_widget_class(FIELD_GETTERS, widget)
+
+
+def set_combo_text(widget, value):
+    """Select a combo box entry by its text, ignoring unknown values"""
+    index = widget.findText(str(value))
+    if index >= 0:
+        widget.setCurrentIndex(index)
+
+
+def set_spin_value(widget, value):
+    """Set a spin box from a stored value, leaving it alone when blank"""
+    if value:
+        widget.setValue(int(value))
+
+
+# How populate_form_fields restores each kind of field, resolved once per widget
+FIELD_SETTERS = {
+    QLineEdit: lambda widget, value: widget.setText(str(value)),
+    QComboBox: set_combo_text,
+    QDateEdit: lambda widget, value: widget.setDate(parse_date(value)),
+    QTextEdit: lambda widget, value: widget.setPlainText(str(value)),
+    QSpinBox: set_spin_value,
+    QCheckBox: lambda widget, value: widget.setChecked(bool(value)),
+    QRadioButton: lambda widget, value: widget.setChecked(bool(value)),
+}
+
+
+def field_setter(widget):
+    """Return the function that restores a field widget's value"""
+    return lookup_widget_class(FIELD_SETTERS, widget)
+
+
+# Signal each kind of field emits when the user edits it
+FIELD_CHANGE_SIGNALS = {
+    QLineEdit: "textChanged",
+    QComboBox: "currentIndexChanged",
+    QDateEdit: "dateChanged",
+    QTextEdit: "textChanged",
+    QSpinBox: "valueChanged",
+    QCheckBox: "toggled",
+    QRadioButton: "toggled",
+}
+
+# Fields whose handlers show or enable other widgets: (handler name, argument
+# read from the field); re-run once after a restore with signals blocked
+DEPENDENT_SECTION_HANDLERS = {
+    "employment_status": ("on_employment_status_changed", QComboBox.currentText),
+    "spouse_applicable": ("on_spouse_applicable_changed", lambda widget: widget.checkState().value),
+    "include_breakdown": ("on_include_breakdown_changed", lambda widget: widget.checkState().value),
+    "has_outside_broker": ("on_has_outside_broker_changed", lambda widget: widget.checkState().value),
+}
+
+# Characters accepted while typing SSNs and phone numbers
+INPUT_PATTERNS = {
+    "ssn": r"[\d-]{0,11}",
+    "phone": r"[\d()+. -]{0,20}",
+}
+
+
+def resource_path(name: str) -> str:
+    """Resolve a bundled resource file, also inside a PyInstaller build"""
+    base_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, name)
+
+
+def load_stylesheet() -> str:
+    """Read the application stylesheet"""
+    try:
+        with open(resource_path(STYLESHEET_FILE), 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError as e:
+        print(f"Failed to load stylesheet: {e}")
+        return ""
+
+
+def apply_app_style(app):
+    """Style the application: Fusion base, palette text colour, then the stylesheet"""
+    app.setStyle("Fusion")
+    palette = app.palette()
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(TEXT_COLOR))
+    app.setPalette(palette)
+    app.setStyleSheet(load_stylesheet())
 
 
 class EnhancedLineEdit(QLineEdit):
     """Enhanced QLineEdit with validation feedback"""
     
+    # Input filters shared by every field of the same kind
+    input_validators = {}
+    
+    @classmethod
+    def shared_input_validator(cls, kind):
+        """Return the input filter for a kind of field, creating it on first use"""
+        validator = cls.input_validators.get(kind)
+        if validator is None:
+            validator = QRegularExpressionValidator(QRegularExpression(INPUT_PATTERNS[kind]))
+            cls.input_validators[kind] = validator
+        return validator
+    
     def __init__(self, field_name: str, parent=None):
         super().__init__(parent)
         self.field_name = field_name
-        self.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border-color: #4CAF50;
-            }
-        """)
+        
+        # Pick the validator once based on field name
+        name = field_name.lower()
+        if "email" in name:
+            self.field_validator = form_validator.validate_email
+        elif "ssn" in name:
+            self.field_validator = form_validator.validate_ssn
+            self.setValidator(self.shared_input_validator("ssn"))
+        elif "phone" in name:
+            self.field_validator = form_validator.validate_phone
+            self.setValidator(self.shared_input_validator("phone"))
+        else:
+            self.field_validator = None
+        
+        # Validate once the user leaves the field rather than on every keystroke
+        self.editingFinished.connect(self.validate_field)
         
     def validate_field(self) -> bool:
         """Validate field content and update styling"""
         text = self.text().strip()
         
-        # Basic validation based on field name
-        if "email" in self.field_name.lower():
-            valid = form_validator.validate_email(self.field_name, text)
-        elif "ssn" in self.field_name.lower():
-            valid = form_validator.validate_ssn(self.field_name, text)
-        elif "phone" in self.field_name.lower():
-            valid = form_validator.validate_phone(self.field_name, text)
+        if self.field_validator is not None:
+            valid = self.field_validator(self.field_name, text)
         else:
             valid = len(text) > 0 if text else True
         
-        # Update styling based on validation
+        # Update styling based on validation; the rules live in styles.qss
         if text and not valid:
-            self.setStyleSheet("""
-                QLineEdit {
-                    padding: 8px;
-                    border: 2px solid #f44336;
-                    border-radius: 4px;
-                    font-size: 12px;
-                    background-color: #ffebee;
-                }
-            """)
+            state = "invalid"
         elif text and valid:
-            self.setStyleSheet("""
-                QLineEdit {
-                    padding: 8px;
-                    border: 2px solid #4CAF50;
-                    border-radius: 4px;
-                    font-size: 12px;
-                    background-color: #e8f5e8;
-                }
-            """)
+            state = "valid"
         else:
-            self.setStyleSheet("""
-                QLineEdit {
-                    padding: 8px;
-                    border: 2px solid #ddd;
-                    border-radius: 4px;
-                    font-size: 12px;
-                }
-            """)
+            state = ""
+        
+        if self.property("state") != state:
+            self.setProperty("state", state)
+            self.style().unpolish(self)
+            self.style().polish(self)
         
         return valid
 
 
+class RowTableModel(QAbstractTableModel):
+    """Table model holding dependent or beneficiary rows as plain dicts"""
+    
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        # (header, key, default) for each column
+        self.columns = columns
+        self.rows = []
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.rows[index.row()].get(self.columns[index.column()][1])
+        return None
+        
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole:
+            return False
+        self.rows[index.row()][self.columns[index.column()][1]] = value
+        self.dataChanged.emit(index, index, [role])
+        return True
+        
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.columns[section][0]
+        return None
+        
+    def new_row(self, values=None):
+        """Build a row dict from the column defaults and any known values"""
+        row = {key: default for _, key, default in self.columns}
+        if values:
+            row.update((key, values[key]) for key in row if key in values)
+        return row
+        
+    def add_row(self, values=None) -> int:
+        """Append a row and return its index"""
+        position = len(self.rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self.rows.append(self.new_row(values))
+        self.endInsertRows()
+        return position
+        
+    def remove_rows(self, rows):
+        """Remove the given row indexes, one notification per contiguous run"""
+        rows = sorted(set(rows), reverse=True)
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.rows[first:last + 1]
+            self.endRemoveRows()
+            
+    def set_rows(self, rows):
+        """Replace all rows, e.g. when restoring a draft"""
+        self.beginResetModel()
+        self.rows = [self.new_row(values) for values in rows]
+        self.endResetModel()
+
+
+class FieldTableModel(RowTableModel):
+    """Fixed rows of flat form fields: a read-only label column, then one column per field"""
+    
+    def __init__(self, columns, row_fields, parent=None):
+        super().__init__(columns, parent)
+        # Per row: the label, then (column key, field name, default) for each field column
+        self.row_cells = tuple(
+            (label, tuple((key, field_name, default)
+                          for (_, key, default), field_name in zip(columns[1:], field_names)))
+            for label, *field_names in row_fields
+        )
+        self.label_key = columns[0][1]
+        
+    def flags(self, index):
+        if index.column() == 0:
+            return Qt.ItemFlag.ItemIsEnabled
+        return super().flags(index)
+        
+    def load(self, data):
+        """Fill the rows from the flat form_data fields"""
+        self.beginResetModel()
+        self.rows = [
+            {self.label_key: label, **{key: data.get(field_name, default) for key, field_name, default in cells}}
+            for label, cells in self.row_cells
+        ]
+        self.endResetModel()
+        
+    def store(self, data):
+        """Write the rows back to the flat form_data fields"""
+        for row, (_, cells) in zip(self.rows, self.row_cells):
+            for key, field_name, _ in cells:
+                data[field_name] = row[key]
+
+
+class DateDelegate(QStyledItemDelegate):
+    """Edits MM/dd/yyyy date strings with a calendar popup"""
+    
+    def createEditor(self, parent, option, index):
+        editor = QDateEdit(parent)
+        editor.setCalendarPopup(True)
+        return editor
+        
+    def setEditorData(self, editor, index):
+        editor.setDate(parse_date(index.data(Qt.ItemDataRole.EditRole) or ""))
+        
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.date().toString(DATE_FORMAT))
+
+
+class PercentageDelegate(QStyledItemDelegate):
+    """Edits allocation percentages with a 0-100 spin box"""
+    
+    def createEditor(self, parent, option, index):
+        editor = QSpinBox(parent)
+        editor.setRange(0, 100)
+        editor.setSuffix("%")
+        return editor
+        
+    def setEditorData(self, editor, index):
+        editor.setValue(int(index.data(Qt.ItemDataRole.EditRole) or 0))
+        
+    def setModelData(self, editor, model, index):
+        editor.interpretText()
+        model.setData(index, editor.value())
+        
+    def displayText(self, value, locale):
+        return f"{value}%"
+
+
+class ComboDelegate(QStyledItemDelegate):
+    """Edits a cell by picking one of a fixed list of choices"""
+    
+    def __init__(self, items, parent=None):
+        super().__init__(parent)
+        self.items = items
+        
+    def createEditor(self, parent, option, index):
+        editor = QComboBox(parent)
+        editor.addItems(self.items)
+        return editor
+        
+    def setEditorData(self, editor, index):
+        editor.setCurrentIndex(max(editor.findText(index.data(Qt.ItemDataRole.EditRole) or ""), 0))
+        
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText())
+
+
+class DocumentWorkerSignals(QObject):
+    """Signals a DocumentWorker emits back to the GUI thread"""
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class DocumentWorker(QRunnable):
+    """Writes a document from a form_data snapshot on a QThreadPool thread"""
+    
+    def __init__(self, write, form_data, file_path):
+        super().__init__()
+        # write(form_data, file_path) returns True on success
+        self.write = write
+        self.form_data = form_data
+        self.file_path = file_path
+        self.signals = DocumentWorkerSignals()
+        
+    def run(self):
+        try:
+            if self.write(self.form_data, self.file_path):
+                self.signals.finished.emit(self.file_path)
+            else:
+                self.signals.failed.emit("")
+        except BaseException as e:
+            # Also catch SystemExit, otherwise the window waits on a job that never reports back
+            import traceback
+            traceback.print_exc()  # Print to console for debugging
+            self.signals.failed.emit(str(e))
+
+
+def write_pdf_report(form_data, file_path):
+    """Render the PDF report; the generator is imported on first use"""
+    from pdf_generator_reportlab import generate_pdf_from_data
+    return generate_pdf_from_data(form_data, file_path)
+
+
+# Columns of the dependents and beneficiaries tables: (header, key, default)
+DEPENDENT_COLUMNS = (
+    ("Full Name", "name", ""),
+    ("Date of Birth", "dob", ""),
+    ("Relationship", "relationship", ""),
+)
+BENEFICIARY_COLUMNS = DEPENDENT_COLUMNS + (
+    ("Allocation (%)", "percentage", 0),
+)
+
+
+# Per widget class configuration applied by create_field
+def setup_combo_field(widget, options):
+    """Fill a combo box with its choices"""
+    widget.addItems(options["items"])
+
+
+def setup_date_field(widget, options):
+    """Show a calendar popup for date fields"""
+    widget.setCalendarPopup(True)
+
+
+def setup_spin_field(widget, options):
+    """Apply the allowed range to a spin box"""
+    widget.setRange(*options["range"])
+
+
+def setup_text_field(widget, options):
+    """Limit the height of a multi-line text field"""
+    widget.setMaximumHeight(options["max_height"])
+
+
+FIELD_SETUP = {
+    QComboBox: setup_combo_field,
+    QDateEdit: setup_date_field,
+    QSpinBox: setup_spin_field,
+    QTextEdit: setup_text_field,
+}
+
+# Drop-down choices shared by the form pages
+CITIZENSHIP_OPTIONS = ("", "US Citizen", "Permanent Resident", "Non-Resident Alien", "Other")
+MARITAL_STATUS_OPTIONS = ("", "Single", "Married", "Divorced", "Widowed", "Separated")
+EMPLOYMENT_STATUS_OPTIONS = (
+    "", "Employed", "Self-Employed", "Unemployed", "Retired",
+    "Student", "Homemaker", "Disabled"
+)
+EDUCATION_OPTIONS = (
+    "", "High School", "Some College", "Associate Degree",
+    "Bachelor's Degree", "Master's Degree", "Doctorate", "Other"
+)
+TAX_BRACKET_OPTIONS = ("", "0-15%", "15%-32%", "32%+")
+RISK_TOLERANCE_OPTIONS = ("", "Conservative", "Moderate", "Moderately Aggressive", "Aggressive")
+ACCOUNT_TYPE_OPTIONS = (
+    "", "Individual", "Joint", "IRA", "Roth IRA",
+    "401(k)", "Trust", "Other"
+)
+EXPERIENCE_LEVEL_OPTIONS = ("", "None", "Limited", "Good", "Extensive")
+
+# Columns of the asset breakdown and experience tables; rows are ASSET_BREAKDOWN_FIELDS
+# and ASSET_EXPERIENCE_FIELDS
+ASSET_BREAKDOWN_COLUMNS = (
+    ("Asset Type", "type", ""),
+    ("Allocation (%)", "percentage", 0),
+)
+ASSET_EXPERIENCE_COLUMNS = (
+    ("Asset Type", "type", ""),
+    ("Year Started", "year", ""),
+    ("Experience Level", "level", ""),
+)
+
+
+# Page field layouts: (label, object name, widget class, options)
+PERSONAL_INFO_FIELDS = (
+    ("Full Legal Name:", "full_name", EnhancedLineEdit, {}),
+    ("Date of Birth:", "dob", QDateEdit, {"years_ago": 30}),
+    ("Social Security Number:", "ssn", EnhancedLineEdit, {"placeholder": "XXX-XX-XXXX"}),
+    ("Citizenship Status:", "citizenship", QComboBox, {"items": CITIZENSHIP_OPTIONS}),
+    ("Marital Status:", "marital_status", QComboBox, {"items": MARITAL_STATUS_OPTIONS}),
+)
+
+CONTACT_INFO_FIELDS = (
+    ("Residential Address:", "residential_address", QTextEdit,
+     {"placeholder": "Street Address\nCity, State ZIP Code", "max_height": 80}),
+    ("Email Address:", "email", EnhancedLineEdit, {"placeholder": "example@email.com"}),
+    ("Home Phone:", "home_phone", EnhancedLineEdit, {"placeholder": "(XXX) XXX-XXXX"}),
+    ("Mobile Phone:", "mobile_phone", EnhancedLineEdit, {"placeholder": "(XXX) XXX-XXXX"}),
+    ("Work Phone:", "work_phone", EnhancedLineEdit, {}),
+)
+
+EMPLOYMENT_INFO_FIELDS = (
+    ("Employment Status:", "employment_status", QComboBox, {"items": EMPLOYMENT_STATUS_OPTIONS}),
+    ("Employer Name:", "employer_name", EnhancedLineEdit, {}),
+    ("Occupation/Job Title:", "occupation", EnhancedLineEdit, {}),
+    ("Years with Current Employer:", "years_employed", QSpinBox, {"range": (0, 50)}),
+    ("Annual Income:", "annual_income", EnhancedLineEdit, {"placeholder": "Enter annual income in USD"}),
+)
+
+RETIREMENT_INFO_FIELDS = (
+    ("Former Employer:", "former_employer", EnhancedLineEdit, {}),
+    ("Source of Income:", "income_source", EnhancedLineEdit, {}),
+)
+
+FINANCIAL_PROFILE_FIELDS = (
+    ("Education Status:", "education_status", QComboBox, {"items": EDUCATION_OPTIONS}),
+    ("Estimated Tax Bracket:", "tax_bracket", QComboBox, {"items": TAX_BRACKET_OPTIONS}),
+    ("Investment Risk Tolerance:", "risk_tolerance", QComboBox, {"items": RISK_TOLERANCE_OPTIONS}),
+)
+
+NET_WORTH_FIELDS = (
+    ("Estimated Net Worth (excluding primary residence):", "net_worth", EnhancedLineEdit,
+     {"placeholder": "Enter estimated net worth in USD"}),
+    ("Estimated Liquid Net Worth (cash + marketable securities):", "liquid_net_worth", EnhancedLineEdit,
+     {"placeholder": "Enter estimated liquid net worth in USD"}),
+    ("Assets Held Away (e.g., Brokerage Accounts, 401k, etc.):", "assets_held_away", EnhancedLineEdit,
+     {"placeholder": "Enter total value of assets held away in USD"}),
+)
+
+SPOUSE_INFO_FIELDS = (
+    ("Full Legal Name:", "spouse_full_name", EnhancedLineEdit, {}),
+    ("Date of Birth:", "spouse_dob", QDateEdit, {"years_ago": 30}),
+    ("Social Security Number:", "spouse_ssn", EnhancedLineEdit, {"placeholder": "XXX-XX-XXXX"}),
+    ("Employment Status:", "spouse_employment_status", QComboBox, {"items": EMPLOYMENT_STATUS_OPTIONS}),
+    ("Employer Name:", "spouse_employer_name", EnhancedLineEdit, {}),
+    ("Occupation/Job Title:", "spouse_occupation", EnhancedLineEdit, {}),
+)
+
+OUTSIDE_BROKER_FIELDS = (
+    ("Firm Name:", "outside_firm_name", EnhancedLineEdit, {}),
+    ("Account Type:", "outside_broker_account_type", QComboBox, {"items": ACCOUNT_TYPE_OPTIONS}),
+    ("Account Number:", "outside_broker_account_number", EnhancedLineEdit, {}),
+    ("Liquid Amount with this Firm:", "outside_liquid_amount", EnhancedLineEdit,
+     {"placeholder": "Enter liquid amount in USD"}),
+)
+
+TRUSTED_CONTACT_FIELDS = (
+    ("Full Legal Name:", "trusted_full_name", EnhancedLineEdit, {}),
+    ("Relationship to You:", "trusted_relationship", EnhancedLineEdit, {}),
+    ("Phone Number:", "trusted_phone", EnhancedLineEdit, {"placeholder": "(XXX) XXX-XXXX"}),
+    ("Email Address:", "trusted_email", EnhancedLineEdit, {"placeholder": "example@email.com"}),
+)
+
+
+# Review text layout
+def format_review_field(label, value):
+    """Format one indented "label: value" line of the review text"""
+    return f"  {label}: {value if value else NOT_PROVIDED}\n"
+
+
+def write_draft_document(template, form_data, file_path):
+    """Fill a copy of the serialized draft template from DRAFT_SECTIONS and save it"""
+    from docx import Document
+    doc = Document(BytesIO(template))
+    add_draft_sections(doc, form_data)
+    doc.save(file_path)
+    return True
+
+
+TRUSTED_CONTACT_INSTRUCTIONS = """
+        Please provide information for a trusted contact person. This person may be contacted 
+        in the event we are unable to reach you, or if we have concerns about your health 
+        or financial exploitation.
+        """
+
+
 class MagnusClientIntakeForm(QMainWindow):
     """Main application window for Magnus Client Intake Form"""
     
@@ -109,10 +601,36 @@ class MagnusClientIntakeForm(QMainWindow):
         super().__init__()
         self.security_manager = DataSecurity()
         self.form_data = {}
+        # Named input widgets of the pages built so far, by object name, and
+        # the (widget, getter) / (widget, setter) pairs used to read and restore them
+        self._fields = {}
+        self._field_readers = {}
+        self._field_writers = {}
+        # Row tables of the pages built so far, by their form_data key
+        self._row_models = {}
+        # Tables whose cells are flat form fields, such as the asset tables
+        self._field_models = []
         self.current_page = 0
-        self.auto_save_timer = QTimer()
-        self.auto_save_timer.timeout.connect(self.auto_save_data)
-        self.auto_save_timer.start(30000)  # Auto-save every 30 seconds
+        # Set by any edit; the review text is only rebuilt when this is set
+        self._review_dirty = True
+        # Serialized blank draft with its title, built on the first save
+        self._draft_template = None
+        # Draft and PDF writers running on the thread pool, if any
+        self._draft_worker = None
+        self._pdf_worker = None
+        
+        # Fonts shared by the header and page titles, built once
+        self.header_font = QFont()
+        self.header_font.setPointSize(18)
+        self.header_font.setBold(True)
+        self.welcome_font = QFont()
+        self.welcome_font.setPointSize(16)
+        self.welcome_font.setBold(True)
+        self.title_font = QFont("Arial", 14, QFont.Weight.Bold)
+        
+        # Default dates are computed from one reading of today's date
+        self.today = QDate.currentDate()
+        self.default_dates = {}
         
         self.init_ui()
         self.load_draft_data()
@@ -138,29 +656,14 @@ class MagnusClientIntakeForm(QMainWindow):
         
         # Title
         title_label = QLabel("Magnus Client Intake Form")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet("color: #2c3e50; margin-bottom: 10px;")
+        title_label.setObjectName("appTitle")
+        title_label.setFont(self.header_font)
         header_layout.addWidget(title_label)
         
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setMaximum(12)
         self.progress_bar.setValue(1)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                text-align: center;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #3498db;
-                border-radius: 3px;
-            }
-        """)
         header_layout.addWidget(self.progress_bar)
         
         main_layout.addLayout(header_layout)
@@ -169,23 +672,103 @@ class MagnusClientIntakeForm(QMainWindow):
         self.stacked_widget = QStackedWidget()
         main_layout.addWidget(self.stacked_widget)
         
-        # Create all pages
-        self.create_welcome_page()           # Page 0
-        self.create_personal_info_page()     # Page 1
-        self.create_contact_info_page()      # Page 2
-        self.create_employment_info_page()   # Page 3
-        self.create_financial_info_page()    # Page 4
-        self.create_spouse_info_page()       # Page 5
-        self.create_dependents_page()        # Page 6
-        self.create_beneficiaries_page()     # Page 7
-        self.create_assets_investment_page() # Page 8
-        self.create_trusted_contact_page()   # Page 9
-        self.create_regulatory_page()        # Page 10
-        self.create_review_submit_page()     # Page 11
+        # Page builders by index; each is popped when its page is first shown
+        page_builders = [
+            self.create_welcome_page,           # Page 0
+            self.create_personal_info_page,     # Page 1
+            self.create_contact_info_page,      # Page 2
+            self.create_employment_info_page,   # Page 3
+            self.create_financial_info_page,    # Page 4
+            self.create_spouse_info_page,       # Page 5
+            self.create_dependents_page,        # Page 6
+            self.create_beneficiaries_page,     # Page 7
+            self.create_assets_investment_page, # Page 8
+            self.create_trusted_contact_page,   # Page 9
+            self.create_regulatory_page,        # Page 10
+            self.create_review_submit_page,     # Page 11
+        ]
+        self._page_builders = dict(enumerate(page_builders))
+        
+        # Placeholders keep page indexes stable until the real page is built
+        for _ in page_builders:
+            self.stacked_widget.addWidget(QWidget())
+        self.ensure_page_built(0)
+        self.stacked_widget.setCurrentIndex(0)
         
         # Status bar
         self.statusBar().showMessage("Ready - Page 1 of 12")
         
+    def create_page_title(self, layout, text):
+        """Add the standard page title to a layout"""
+        title = QLabel(text)
+        title.setProperty("role", "title")
+        title.setFont(self.title_font)
+        layout.addWidget(title)
+        return title
+        
+    def create_field(self, widget_class, object_name, options):
+        """Create an input widget from a field specification"""
+        if widget_class is EnhancedLineEdit:
+            widget = EnhancedLineEdit(object_name)
+        else:
+            widget = widget_class()
+        widget.setObjectName(object_name)
+        
+        if "placeholder" in options:
+            widget.setPlaceholderText(options["placeholder"])
+        if "years_ago" in options:
+            widget.setDate(self.default_date(options["years_ago"]))
+        
+        setup = FIELD_SETUP.get(widget_class)
+        if setup:
+            setup(widget, options)
+        
+        return widget
+        
+    def default_date(self, years_ago):
+        """Return the shared default date a number of years before today"""
+        default = self.default_dates.get(years_ago)
+        if default is None:
+            default = self.default_dates[years_ago] = self.today.addYears(-years_ago)
+        return default
+        
+    def add_fields(self, layout, fields):
+        """Add a form with a labelled row for each field specification to the layout"""
+        form = QFormLayout()
+        form.setContentsMargins(0, 0, 0, 0)
+        # Keep labels above their inputs, as on the rest of the form
+        form.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows)
+        form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
+        
+        widgets = {}
+        for label, object_name, widget_class, options in fields:
+            widget = self.create_field(widget_class, object_name, options)
+            form.addRow(label, widget)
+            widgets[object_name] = widget
+        
+        layout.addLayout(form)
+        return widgets
+        
+    def create_form_page(self, title, fields, back_index, next_index, instructions=None):
+        """Create a page consisting of a title and a plain list of fields"""
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        
+        self.create_page_title(layout, title)
+        
+        if instructions:
+            instructions_label = QLabel(instructions)
+            instructions_label.setProperty("role", "instructions")
+            instructions_label.setWordWrap(True)
+            layout.addWidget(instructions_label)
+        
+        self.add_fields(layout, fields)
+        
+        layout.addStretch()
+        layout.addLayout(self.create_navigation_buttons(back_index=back_index, next_index=next_index))
+        
+        return widget
+        
     def create_welcome_page(self):
         """Create the welcome page"""
         widget = QWidget()
@@ -194,12 +777,9 @@ class MagnusClientIntakeForm(QMainWindow):
         
         # Welcome message
         welcome_label = QLabel("Welcome to Magnus Client Intake Form")
-        welcome_font = QFont()
-        welcome_font.setPointSize(16)
-        welcome_font.setBold(True)
-        welcome_label.setFont(welcome_font)
+        welcome_label.setFont(self.welcome_font)
+        welcome_label.setObjectName("welcomeTitle")
         welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        welcome_label.setStyleSheet("color: #2c3e50; margin: 20px;")
         layout.addWidget(welcome_label)
         
         # Instructions
@@ -214,237 +794,47 @@ class MagnusClientIntakeForm(QMainWindow):
         • Contact details for trusted persons
         
         The form includes 12 sections and takes approximately 15-20 minutes to complete.
-        Your progress is automatically saved every 30 seconds.
+        Use Save Draft at any time to keep a Word copy of your progress.
         """)
+        instructions.setObjectName("welcomeInstructions")
         instructions.setWordWrap(True)
-        instructions.setStyleSheet("""
-            QLabel {
-                background-color: #ecf0f1;
-                padding: 20px;
-                border-radius: 8px;
-                font-size: 12px;
-                line-height: 1.5;
-            }
-        """)
         layout.addWidget(instructions)
         
         # Navigation buttons
         layout.addLayout(self.create_navigation_buttons(back_index=None, next_index=1))
         
-        self.stacked_widget.addWidget(widget)
+        return widget
         
     def create_personal_info_page(self):
         """Create the personal information page"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        # Page title
-        title = QLabel("Personal Information")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
-        layout.addWidget(title)
-        
-        # Form fields
-        layout.addWidget(QLabel("Full Legal Name:"))
-        full_name_input = EnhancedLineEdit("full_name")
-        full_name_input.setObjectName("full_name")
-        layout.addWidget(full_name_input)
-        
-        layout.addWidget(QLabel("Date of Birth:"))
-        dob_input = QDateEdit()
-        dob_input.setObjectName("dob")
-        dob_input.setDate(QDate.currentDate().addYears(-30))
-        dob_input.setCalendarPopup(True)
-        dob_input.setStyleSheet("""
-            QDateEdit {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        layout.addWidget(dob_input)
-        
-        layout.addWidget(QLabel("Social Security Number:"))
-        ssn_input = EnhancedLineEdit("ssn")
-        ssn_input.setObjectName("ssn")
-        ssn_input.setPlaceholderText("XXX-XX-XXXX")
-        layout.addWidget(ssn_input)
-        
-        layout.addWidget(QLabel("Citizenship Status:"))
-        citizenship_combo = QComboBox()
-        citizenship_combo.setObjectName("citizenship")
-        citizenship_combo.addItems(["", "US Citizen", "Permanent Resident", "Non-Resident Alien", "Other"])
-        citizenship_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        layout.addWidget(citizenship_combo)
-        
-        layout.addWidget(QLabel("Marital Status:"))
-        marital_combo = QComboBox()
-        marital_combo.setObjectName("marital_status")
-        marital_combo.addItems(["", "Single", "Married", "Divorced", "Widowed", "Separated"])
-        marital_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        layout.addWidget(marital_combo)
-        
-        layout.addStretch()
-        layout.addLayout(self.create_navigation_buttons(back_index=0, next_index=2))
-        
-        self.stacked_widget.addWidget(widget)
+        return self.create_form_page("Personal Information", PERSONAL_INFO_FIELDS, back_index=0, next_index=2)
         
     def create_contact_info_page(self):
         """Create the contact information page"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        # Page title
-        title = QLabel("Contact Information")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
-        layout.addWidget(title)
-        
-        # Residential Address
-        layout.addWidget(QLabel("Residential Address:"))
-        address_input = QTextEdit()
-        address_input.setObjectName("residential_address")
-        address_input.setMaximumHeight(80)
-        address_input.setPlaceholderText("Street Address\nCity, State ZIP Code")
-        address_input.setStyleSheet("""
-            QTextEdit {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        layout.addWidget(address_input)
-        
-        # Email
-        layout.addWidget(QLabel("Email Address:"))
-        email_input = EnhancedLineEdit("email")
-        email_input.setObjectName("email")
-        email_input.setPlaceholderText("example@email.com")
-        layout.addWidget(email_input)
-        
-        # Phone numbers
-        layout.addWidget(QLabel("Home Phone:"))
-        home_phone_input = EnhancedLineEdit("home_phone")
-        home_phone_input.setObjectName("home_phone")
-        home_phone_input.setPlaceholderText("(XXX) XXX-XXXX")
-        layout.addWidget(home_phone_input)
-        
-        layout.addWidget(QLabel("Mobile Phone:"))
-        mobile_phone_input = EnhancedLineEdit("mobile_phone")
-        mobile_phone_input.setObjectName("mobile_phone")
-        mobile_phone_input.setPlaceholderText("(XXX) XXX-XXXX")
-        layout.addWidget(mobile_phone_input)
-        
-        layout.addWidget(QLabel("Work Phone:"))
-        work_phone_input = EnhancedLineEdit("work_phone")
-        work_phone_input.setObjectName("work_phone")
-        layout.addWidget(work_phone_input)
-        
-        layout.addStretch()
-        layout.addLayout(self.create_navigation_buttons(back_index=1, next_index=3))
-        
-        self.stacked_widget.addWidget(widget)
+        return self.create_form_page("Contact Information", CONTACT_INFO_FIELDS, back_index=1, next_index=3)
         
     def create_employment_info_page(self):
         """Create the employment information page"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
-        # Page title
-        title = QLabel("Employment Information")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
-        layout.addWidget(title)
+        self.create_page_title(layout, "Employment Information")
         
-        # Employment Status
-        layout.addWidget(QLabel("Employment Status:"))
-        employment_combo = QComboBox()
-        employment_combo.setObjectName("employment_status")
-        employment_combo.addItems([
-            "", "Employed", "Self-Employed", "Unemployed", "Retired", 
-            "Student", "Homemaker", "Disabled"
-        ])
-        employment_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        employment_combo.currentTextChanged.connect(self.on_employment_status_changed)
-        layout.addWidget(employment_combo)
-        
-        # Employer Information
-        layout.addWidget(QLabel("Employer Name:"))
-        employer_input = EnhancedLineEdit("employer_name")
-        employer_input.setObjectName("employer_name")
-        layout.addWidget(employer_input)
-        
-        layout.addWidget(QLabel("Occupation/Job Title:"))
-        occupation_input = EnhancedLineEdit("occupation")
-        occupation_input.setObjectName("occupation")
-        layout.addWidget(occupation_input)
-        
-        layout.addWidget(QLabel("Years with Current Employer:"))
-        years_employed_input = QSpinBox()
-        years_employed_input.setObjectName("years_employed")
-        years_employed_input.setRange(0, 50)
-        years_employed_input.setStyleSheet("""
-            QSpinBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        layout.addWidget(years_employed_input)
-        
-        # Annual Income
-        layout.addWidget(QLabel("Annual Income:"))
-        annual_income_input = EnhancedLineEdit("annual_income")
-        annual_income_input.setObjectName("annual_income")
-        annual_income_input.setPlaceholderText("Enter annual income in USD")
-        layout.addWidget(annual_income_input)
+        fields = self.add_fields(layout, EMPLOYMENT_INFO_FIELDS)
+        fields["employment_status"].currentTextChanged.connect(self.on_employment_status_changed)
         
         # Retirement-specific fields (initially hidden)
         self.retirement_group = QGroupBox("Retirement Information")
         self.retirement_group.setObjectName("retirement_group")
         self.retirement_group.setVisible(False)
         retirement_layout = QVBoxLayout(self.retirement_group)
-        
-        retirement_layout.addWidget(QLabel("Former Employer:"))
-        former_employer_input = EnhancedLineEdit("former_employer")
-        former_employer_input.setObjectName("former_employer")
-        retirement_layout.addWidget(former_employer_input)
-        
-        retirement_layout.addWidget(QLabel("Source of Income:"))
-        income_source_input = EnhancedLineEdit("income_source")
-        income_source_input.setObjectName("income_source")
-        retirement_layout.addWidget(income_source_input)
-        
+        self.add_fields(retirement_layout, RETIREMENT_INFO_FIELDS)
         layout.addWidget(self.retirement_group)
         
         layout.addStretch()
         layout.addLayout(self.create_navigation_buttons(back_index=2, next_index=4))
         
-        self.stacked_widget.addWidget(widget)
+        return widget
         
     def on_employment_status_changed(self, text):
         """Handle employment status change to show/hide retirement fields"""
@@ -458,11 +848,7 @@ class MagnusClientIntakeForm(QMainWindow):
         widget = QWidget()
         main_layout = QVBoxLayout(widget)
         
-        # Page title
-        title = QLabel("Financial Information")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
-        main_layout.addWidget(title)
+        self.create_page_title(main_layout, "Financial Information")
         
         # Create scroll area
         scroll_area = QScrollArea()
@@ -473,179 +859,43 @@ class MagnusClientIntakeForm(QMainWindow):
         content_widget = QWidget()
         layout = QVBoxLayout(content_widget)
         
-        # Education Status
-        layout.addWidget(QLabel("Education Status:"))
-        education_combo = QComboBox()
-        education_combo.setObjectName("education_status")
-        education_combo.addItems([
-            "", "High School", "Some College", "Associate Degree", 
-            "Bachelor's Degree", "Master's Degree", "Doctorate", "Other"
-        ])
-        education_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        layout.addWidget(education_combo)
-        
-        # Tax Bracket
-        layout.addWidget(QLabel("Estimated Tax Bracket:"))
-        tax_bracket_combo = QComboBox()
-        tax_bracket_combo.setObjectName("tax_bracket")
-        tax_bracket_combo.addItems([
-            "", "0-15%", "15%-32%", "32%+"
-        ])
-        tax_bracket_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        layout.addWidget(tax_bracket_combo)
-        
-        # Risk Tolerance
-        layout.addWidget(QLabel("Investment Risk Tolerance:"))
-        risk_combo = QComboBox()
-        risk_combo.setObjectName("risk_tolerance")
-        risk_combo.addItems([
-            "", "Conservative", "Moderate", "Moderately Aggressive", "Aggressive"
-        ])
-        risk_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        layout.addWidget(risk_combo)
+        self.add_fields(layout, FINANCIAL_PROFILE_FIELDS)
         
         # Investment Purpose
         purpose_label = QLabel("Investment Purpose:")
-        purpose_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        purpose_label.setProperty("role", "section")
         layout.addWidget(purpose_label)
         
         purpose_group = QGroupBox()
-        purpose_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                margin-top: 5px;
-                padding: 10px;
-                background-color: #f8f9fa;
-            }
-            QCheckBox {
-                spacing: 8px;
-                font-size: 12px;
-                padding: 5px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #bdc3c7;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #28a745;
-                border-color: #28a745;
-            }
-        """)
+        purpose_group.setProperty("role", "choices")
         purpose_layout = QVBoxLayout(purpose_group)
         
-        purpose_options = ["Income", "Growth and Income", "Capital Appreciation", "Speculation"]
-        self.purpose_checkboxes = {}
-        
-        for purpose in purpose_options:
+        for purpose, field_name in INVESTMENT_PURPOSE_FIELDS:
             checkbox = QCheckBox(purpose)
-            checkbox.setObjectName(f"investment_purpose_{purpose.lower().replace(' ', '_')}")
-            self.purpose_checkboxes[purpose] = checkbox
+            checkbox.setObjectName(field_name)
             purpose_layout.addWidget(checkbox)
         
         layout.addWidget(purpose_group)
         
         # Investment Objectives Ranking
         objectives_label = QLabel("Investment Objectives (Rank 1-5, where 1 is highest priority):")
-        objectives_label.setStyleSheet("font-weight: bold; margin-top: 15px;")
+        objectives_label.setProperty("role", "section")
         layout.addWidget(objectives_label)
         
         objectives_group = QGroupBox()
-        objectives_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                margin-top: 5px;
-                padding: 10px;
-                background-color: #f8f9fa;
-            }
-            QSpinBox {
-                padding: 8px;
-                border: 2px solid #bdc3c7;
-                border-radius: 4px;
-                min-width: 80px;
-                font-size: 12px;
-            }
-            QLabel {
-                font-size: 12px;
-                padding: 5px;
-            }
-        """)
-        objectives_layout = QVBoxLayout(objectives_group)
+        objectives_group.setProperty("role", "choices")
+        objectives_layout = QFormLayout(objectives_group)
         
-        objectives = [
-            "Trading Profits", "Speculation", "Capital Appreciation", 
-            "Income", "Preservation of Capital"
-        ]
-        self.objective_spinboxes = {}
-        
-        for objective in objectives:
-            h_layout = QHBoxLayout()
-            label = QLabel(objective)
-            label.setMinimumWidth(200)  # Ensure consistent label width
+        for objective, field_name in INVESTMENT_OBJECTIVE_FIELDS:
             spinbox = QSpinBox()
-            spinbox.setObjectName(f"investment_objective_{objective.lower().replace(' ', '_')}")
+            spinbox.setObjectName(field_name)
             spinbox.setRange(1, 5)
             spinbox.setValue(3)  # Default to middle priority
-            spinbox.setStyleSheet("""
-                QSpinBox {
-                    padding: 8px;
-                    border: 2px solid #bdc3c7;
-                    border-radius: 4px;
-                }
-            """)
-            
-            self.objective_spinboxes[objective] = spinbox
-            h_layout.addWidget(label)
-            h_layout.addWidget(spinbox)
-            h_layout.addStretch()
-            objectives_layout.addLayout(h_layout)
+            objectives_layout.addRow(objective, spinbox)
         
         layout.addWidget(objectives_group)
         
-        # Net Worth
-        layout.addWidget(QLabel("Estimated Net Worth (excluding primary residence):"))
-        net_worth_input = EnhancedLineEdit("net_worth")
-        net_worth_input.setObjectName("net_worth")
-        net_worth_input.setPlaceholderText("Enter estimated net worth in USD")
-        layout.addWidget(net_worth_input)
-        
-        # Liquid Net Worth
-        layout.addWidget(QLabel("Estimated Liquid Net Worth (cash + marketable securities):"))
-        liquid_net_worth_input = EnhancedLineEdit("liquid_net_worth")
-        liquid_net_worth_input.setObjectName("liquid_net_worth")
-        liquid_net_worth_input.setPlaceholderText("Enter estimated liquid net worth in USD")
-        layout.addWidget(liquid_net_worth_input)
-        
-        # Assets Held Away
-        layout.addWidget(QLabel("Assets Held Away (e.g., Brokerage Accounts, 401k, etc.):"))
-        assets_held_away_input = EnhancedLineEdit("assets_held_away")
-        assets_held_away_input.setObjectName("assets_held_away")
-        assets_held_away_input.setPlaceholderText("Enter total value of assets held away in USD")
-        layout.addWidget(assets_held_away_input)
+        self.add_fields(layout, NET_WORTH_FIELDS)
         
         # Add the content widget to the scroll area
         scroll_area.setWidget(content_widget)
@@ -654,18 +904,14 @@ class MagnusClientIntakeForm(QMainWindow):
         # Navigation buttons
         main_layout.addLayout(self.create_navigation_buttons(back_index=3, next_index=5))
         
-        self.stacked_widget.addWidget(widget)
+        return widget
         
     def create_spouse_info_page(self):
         """Create the spouse information page"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
-        # Page title
-        title = QLabel("Spouse/Partner Information")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
-        layout.addWidget(title)
+        self.create_page_title(layout, "Spouse/Partner Information")
         
         # Checkbox for spouse applicability
         spouse_applicable_checkbox = QCheckBox("N/A (I do not have a spouse/partner)")
@@ -673,351 +919,168 @@ class MagnusClientIntakeForm(QMainWindow):
         spouse_applicable_checkbox.stateChanged.connect(self.on_spouse_applicable_changed)
         layout.addWidget(spouse_applicable_checkbox)
         
-        # Spouse Name
-        layout.addWidget(QLabel("Full Legal Name:"))
-        spouse_name_input = EnhancedLineEdit("spouse_full_name")
-        spouse_name_input.setObjectName("spouse_full_name")
-        layout.addWidget(spouse_name_input)
-        
-        # Spouse Date of Birth
-        layout.addWidget(QLabel("Date of Birth:"))
-        spouse_dob_input = QDateEdit()
-        spouse_dob_input.setObjectName("spouse_dob")
-        spouse_dob_input.setDate(QDate.currentDate().addYears(-30))
-        spouse_dob_input.setCalendarPopup(True)
-        spouse_dob_input.setStyleSheet("""
-            QDateEdit {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        layout.addWidget(spouse_dob_input)
-        
-        # Spouse SSN
-        layout.addWidget(QLabel("Social Security Number:"))
-        spouse_ssn_input = EnhancedLineEdit("spouse_ssn")
-        spouse_ssn_input.setObjectName("spouse_ssn")
-        spouse_ssn_input.setPlaceholderText("XXX-XX-XXXX")
-        layout.addWidget(spouse_ssn_input)
-        
-        # Spouse Employment Status
-        layout.addWidget(QLabel("Employment Status:"))
-        spouse_employment_combo = QComboBox()
-        spouse_employment_combo.setObjectName("spouse_employment_status")
-        spouse_employment_combo.addItems([
-            "", "Employed", "Self-Employed", "Unemployed", "Retired", 
-            "Student", "Homemaker", "Disabled"
-        ])
-        spouse_employment_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        layout.addWidget(spouse_employment_combo)
-        
-        # Spouse Employer Information
-        layout.addWidget(QLabel("Employer Name:"))
-        spouse_employer_input = EnhancedLineEdit("spouse_employer_name")
-        spouse_employer_input.setObjectName("spouse_employer_name")
-        layout.addWidget(spouse_employer_input)
-        
-        layout.addWidget(QLabel("Occupation/Job Title:"))
-        spouse_occupation_input = EnhancedLineEdit("spouse_occupation")
-        spouse_occupation_input.setObjectName("spouse_occupation")
-        layout.addWidget(spouse_occupation_input)
+        # Keep references so the N/A toggle does not have to search the widget tree
+        self.spouse_widgets = list(self.add_fields(layout, SPOUSE_INFO_FIELDS).values())
         
         layout.addStretch()
         layout.addLayout(self.create_navigation_buttons(back_index=4, next_index=6))
         
-        self.stacked_widget.addWidget(widget)
+        return widget
         
     def on_spouse_applicable_changed(self, state):
         """Handle spouse applicable checkbox change"""
         is_checked = state == Qt.CheckState.Checked.value
         
         # Disable/enable spouse-related fields
-        for widget_name in [
-            "spouse_full_name", "spouse_dob", "spouse_ssn", 
-            "spouse_employment_status", "spouse_employer_name", "spouse_occupation"
-        ]:
-            widget = self.findChild(QWidget, widget_name)
-            if widget:
-                widget.setEnabled(not is_checked)
+        for widget in self.spouse_widgets:
+            widget.setEnabled(not is_checked)
                 
     def create_dependents_page(self):
         """Create the dependents information page"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
-        # Page title
-        title = QLabel("Dependents Information")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
-        layout.addWidget(title)
+        self.create_page_title(layout, "Dependents Information")
         
-        # Dependents list container
-        self.dependents_layout = QVBoxLayout()
-        self.dependents_layout.setSpacing(10)
-        
-        self.dependents_scroll_area = QScrollArea()
-        self.dependents_scroll_area.setWidgetResizable(True)
-        self.dependents_scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        
-        dependents_container = QWidget()
-        dependents_container.setLayout(self.dependents_layout)
-        self.dependents_scroll_area.setWidget(dependents_container)
-        
-        layout.addWidget(self.dependents_scroll_area)
-        
-        # Add Dependent button
-        add_dependent_btn = QPushButton("Add Dependent")
-        add_dependent_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #17a2b8;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #138496;
-            }
-        """)
-        add_dependent_btn.clicked.connect(self.add_dependent_field)
-        layout.addWidget(add_dependent_btn)
+        # Dependents table; rows live in the model rather than in per-row widgets
+        self.dependents_model = self.create_row_model("dependents", DEPENDENT_COLUMNS)
+        self.dependents_table = self.create_row_table(self.dependents_model)
+        layout.addWidget(self.dependents_table)
+        
+        # Add / Remove Dependent buttons
+        layout.addLayout(self.create_row_buttons(
+            "Dependent", self.add_dependent_field, self.remove_dependent_field))
         
-        layout.addStretch()
         layout.addLayout(self.create_navigation_buttons(back_index=5, next_index=7))
         
-        self.stacked_widget.addWidget(widget)
+        return widget
+        
+    def create_row_model(self, key, columns):
+        """Create a row model seeded from form_data[key] and register it for collection"""
+        model = RowTableModel(columns, self)
+        model.set_rows(self.form_data.get(key) or [])
+        self._row_models[key] = model
+        return model
+        
+    def create_field_table(self, columns, row_fields):
+        """Create a fixed-row table over flat form fields, sized to show every row"""
+        model = FieldTableModel(columns, row_fields, self)
+        model.load(self.form_data)
+        self._field_models.append(model)
+        table = self.create_row_table(model)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        table.setFixedHeight(
+            table.horizontalHeader().sizeHint().height()
+            + table.verticalHeader().defaultSectionSize() * model.rowCount()
+            + 2 * table.frameWidth()
+        )
+        return table
+        
+    def create_row_table(self, model):
+        """Create a table view editing a RowTableModel"""
+        table = QTableView()
+        table.setModel(model)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.SelectedClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
+            | QAbstractItemView.EditTrigger.AnyKeyPressed
+        )
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        table.verticalHeader().setVisible(False)
+        
+        for column, (_, key, _) in enumerate(model.columns):
+            if key == "dob":
+                table.setItemDelegateForColumn(column, DateDelegate(table))
+            elif key == "percentage":
+                table.setItemDelegateForColumn(column, PercentageDelegate(table))
+            elif key == "level":
+                table.setItemDelegateForColumn(column, ComboDelegate(EXPERIENCE_LEVEL_OPTIONS, table))
+        
+        model.dataChanged.connect(self.mark_dirty)
+        model.rowsInserted.connect(self.mark_dirty)
+        model.rowsRemoved.connect(self.mark_dirty)
+        return table
+        
+    def create_row_buttons(self, label, add_slot, remove_slot):
+        """Create the Add / Remove buttons below a row table"""
+        buttons_layout = QHBoxLayout()
+        
+        add_btn = QPushButton(f"Add {label}")
+        add_btn.setProperty("kind", "info")
+        add_btn.clicked.connect(partial(add_slot, None))
+        buttons_layout.addWidget(add_btn)
+        
+        remove_btn = QPushButton(f"Remove {label}")
+        remove_btn.setProperty("kind", "danger")
+        remove_btn.clicked.connect(remove_slot)
+        buttons_layout.addWidget(remove_btn)
+        
+        buttons_layout.addStretch()
+        return buttons_layout
+        
+    def add_table_row(self, table, values, edit=False):
+        """Append a row to a table, optionally starting to edit it"""
+        row = table.model().add_row(values)
+        if edit:
+            index = table.model().index(row, 0)
+            table.setCurrentIndex(index)
+            table.edit(index)
+        
+    def remove_selected_rows(self, table):
+        """Remove the rows selected in a table"""
+        table.model().remove_rows(index.row() for index in table.selectionModel().selectedRows())
         
     def add_dependent_field(self, dependent_data=None):
-        """Add fields for a new dependent"""
-        dependent_frame = QFrame()
-        dependent_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        dependent_frame.setFrameShadow(QFrame.Shadow.Raised)
-        dependent_frame.setStyleSheet("""
-            QFrame {
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                padding: 10px;
-                background-color: #f0f0f0;
-            }
-        """)
-        
-        frame_layout = QVBoxLayout(dependent_frame)
-        
-        # Name
-        frame_layout.addWidget(QLabel("Dependent Full Name:"))
-        name_input = EnhancedLineEdit("dependent_name")
-        name_input.setObjectName(f"dependent_name_{self.dependents_layout.count()}")
-        frame_layout.addWidget(name_input)
-        
-        # Date of Birth
-        frame_layout.addWidget(QLabel("Dependent Date of Birth:"))
-        dob_input = QDateEdit()
-        dob_input.setObjectName(f"dependent_dob_{self.dependents_layout.count()}")
-        dob_input.setDate(QDate.currentDate().addYears(-10))
-        dob_input.setCalendarPopup(True)
-        dob_input.setStyleSheet("""
-            QDateEdit {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        frame_layout.addWidget(dob_input)
-        
-        # Relationship
-        frame_layout.addWidget(QLabel("Relationship:"))
-        relationship_input = EnhancedLineEdit("dependent_relationship")
-        relationship_input.setObjectName(f"dependent_relationship_{self.dependents_layout.count()}")
-        frame_layout.addWidget(relationship_input)
-        
-        # Remove button
-        remove_btn = QPushButton("Remove Dependent")
-        remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                padding: 5px 10px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
-        remove_btn.clicked.connect(lambda: self.remove_dependent_field(dependent_frame))
-        frame_layout.addWidget(remove_btn)
-        
-        self.dependents_layout.addWidget(dependent_frame)
-        
+        """Add a row for a new dependent"""
+        values = {"dob": self.default_date(10).toString(DATE_FORMAT)}
         if dependent_data:
-            name_input.setText(dependent_data.get("name", ""))
-            dob_input.setDate(QDate.fromString(dependent_data.get("dob", ""), "MM/dd/yyyy"))
-            relationship_input.setText(dependent_data.get("relationship", ""))
+            values.update(dependent_data)
+        self.add_table_row(self.dependents_table, values, edit=not dependent_data)
             
-    def remove_dependent_field(self, frame):
-        """Remove dependent fields"""
-        frame.deleteLater()
+    def remove_dependent_field(self):
+        """Remove the selected dependents"""
+        self.remove_selected_rows(self.dependents_table)
         
     def create_beneficiaries_page(self):
         """Create the beneficiaries information page"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
-        # Page title
-        title = QLabel("Beneficiaries Information")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
-        layout.addWidget(title)
+        self.create_page_title(layout, "Beneficiaries Information")
         
-        # Beneficiaries list container
-        self.beneficiaries_layout = QVBoxLayout()
-        self.beneficiaries_layout.setSpacing(10)
-        
-        self.beneficiaries_scroll_area = QScrollArea()
-        self.beneficiaries_scroll_area.setWidgetResizable(True)
-        self.beneficiaries_scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        
-        beneficiaries_container = QWidget()
-        beneficiaries_container.setLayout(self.beneficiaries_layout)
-        self.beneficiaries_scroll_area.setWidget(beneficiaries_container)
-        
-        layout.addWidget(self.beneficiaries_scroll_area)
-        
-        # Add Beneficiary button
-        add_beneficiary_btn = QPushButton("Add Beneficiary")
-        add_beneficiary_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #17a2b8;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #138496;
-            }
-        """)
-        add_beneficiary_btn.clicked.connect(self.add_beneficiary_field)
-        layout.addWidget(add_beneficiary_btn)
+        # Beneficiaries table
+        self.beneficiaries_model = self.create_row_model("beneficiaries", BENEFICIARY_COLUMNS)
+        self.beneficiaries_table = self.create_row_table(self.beneficiaries_model)
+        layout.addWidget(self.beneficiaries_table)
+        
+        # Add / Remove Beneficiary buttons
+        layout.addLayout(self.create_row_buttons(
+            "Beneficiary", self.add_beneficiary_field, self.remove_beneficiary_field))
         
-        layout.addStretch()
         layout.addLayout(self.create_navigation_buttons(back_index=6, next_index=8))
         
-        self.stacked_widget.addWidget(widget)
+        return widget
         
     def add_beneficiary_field(self, beneficiary_data=None):
-        """Add fields for a new beneficiary"""
-        beneficiary_frame = QFrame()
-        beneficiary_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        beneficiary_frame.setFrameShadow(QFrame.Shadow.Raised)
-        beneficiary_frame.setStyleSheet("""
-            QFrame {
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                padding: 10px;
-                background-color: #f0f0f0;
-            }
-        """)
-        
-        frame_layout = QVBoxLayout(beneficiary_frame)
-        
-        # Name
-        frame_layout.addWidget(QLabel("Beneficiary Full Name:"))
-        name_input = EnhancedLineEdit("beneficiary_name")
-        name_input.setObjectName(f"beneficiary_name_{self.beneficiaries_layout.count()}")
-        frame_layout.addWidget(name_input)
-        
-        # Date of Birth
-        frame_layout.addWidget(QLabel("Beneficiary Date of Birth:"))
-        dob_input = QDateEdit()
-        dob_input.setObjectName(f"beneficiary_dob_{self.beneficiaries_layout.count()}")
-        dob_input.setDate(QDate.currentDate().addYears(-10))
-        dob_input.setCalendarPopup(True)
-        dob_input.setStyleSheet("""
-            QDateEdit {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        frame_layout.addWidget(dob_input)
-        
-        # Relationship
-        frame_layout.addWidget(QLabel("Relationship:"))
-        relationship_input = EnhancedLineEdit("beneficiary_relationship")
-        relationship_input.setObjectName(f"beneficiary_relationship_{self.beneficiaries_layout.count()}")
-        frame_layout.addWidget(relationship_input)
-        
-        # Percentage
-        frame_layout.addWidget(QLabel("Allocation Percentage (%):"))
-        percentage_spin = QSpinBox()
-        percentage_spin.setObjectName(f"beneficiary_percentage_{self.beneficiaries_layout.count()}")
-        percentage_spin.setRange(0, 100)
-        percentage_spin.setSuffix("%")
-        percentage_spin.setStyleSheet("""
-            QSpinBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
-        frame_layout.addWidget(percentage_spin)
-        
-        # Remove button
-        remove_btn = QPushButton("Remove Beneficiary")
-        remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                padding: 5px 10px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
-        remove_btn.clicked.connect(lambda: self.remove_beneficiary_field(beneficiary_frame))
-        frame_layout.addWidget(remove_btn)
-        
-        self.beneficiaries_layout.addWidget(beneficiary_frame)
-        
+        """Add a row for a new beneficiary"""
+        values = {"dob": self.default_date(10).toString(DATE_FORMAT)}
         if beneficiary_data:
-            name_input.setText(beneficiary_data.get("name", ""))
-            dob_input.setDate(QDate.fromString(beneficiary_data.get("dob", ""), "MM/dd/yyyy"))
-            relationship_input.setText(beneficiary_data.get("relationship", ""))
-            percentage_spin.setValue(beneficiary_data.get("percentage", 0))
+            values.update(beneficiary_data)
+        self.add_table_row(self.beneficiaries_table, values, edit=not beneficiary_data)
             
-    def remove_beneficiary_field(self, frame):
-        """Remove beneficiary fields"""
-        frame.deleteLater()
+    def remove_beneficiary_field(self):
+        """Remove the selected beneficiaries"""
+        self.remove_selected_rows(self.beneficiaries_table)
         
     def create_assets_investment_page(self):
         """Create the assets and investment experience page"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
-        # Page title
-        title = QLabel("Assets & Investment Experience")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
-        layout.addWidget(title)
+        self.create_page_title(layout, "Assets & Investment Experience")
         
         # Create a scroll area for the entire content
         scroll_area = QScrollArea()
@@ -1039,106 +1102,17 @@ class MagnusClientIntakeForm(QMainWindow):
         self.asset_breakdown_group.setVisible(False)
         
         breakdown_layout = QVBoxLayout(self.asset_breakdown_group)
-        self.asset_breakdown_fields = {}
-        
-        asset_types = [
-            "Stocks", "Bonds", "Mutual Funds", "ETFs", "UITs", 
-            "Annuities (Fixed)", "Annuities (Variable)", "Options", 
-            "Commodities", "Alternative Investments", "Limited Partnerships", 
-            "Variable Contracts", "Short-Term", "Other"
-        ]
-        
-        for asset_type in asset_types:
-            h_layout = QHBoxLayout()
-            label = QLabel(f"{asset_type} (%):")
-            spin_box = QSpinBox()
-            spin_box.setObjectName(f"asset_breakdown_{asset_type.lower().replace(' ', '_').replace('(', '').replace(')', '')}")
-            spin_box.setRange(0, 100)
-            spin_box.setSuffix("%")
-
-            self.asset_breakdown_fields[asset_type] = spin_box
-            h_layout.addWidget(label)
-            h_layout.addWidget(spin_box)
-            breakdown_layout.addLayout(h_layout)
+        breakdown_layout.addWidget(self.create_field_table(ASSET_BREAKDOWN_COLUMNS, ASSET_BREAKDOWN_FIELDS))
             
         content_layout.addWidget(self.asset_breakdown_group)
         
         # Investment Experience by Asset Type
         experience_label = QLabel("Investment Experience by Asset Type:")
-        experience_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        experience_label.setProperty("role", "section")
         content_layout.addWidget(experience_label)
         
-        # Create a scroll area specifically for investment experience
-        experience_scroll = QScrollArea()
-        experience_scroll.setWidgetResizable(True)
-        experience_scroll.setFrameShape(QFrame.Shape.NoFrame)
-        experience_scroll.setMinimumHeight(300)  # Set minimum height for better visibility
-        
-        experience_widget = QWidget()
-        self.asset_experience_layout = QVBoxLayout(experience_widget)
-        self.asset_experience_fields = {}
-        
-        experience_types = [
-            "Stocks", "Bonds", "Mutual Funds", "UITs", 
-            "Annuities (Fixed)", "Annuities (Variable)", "Options", 
-            "Commodities", "Alternative Investments", "Limited Partnerships", 
-            "Variable Contracts"
-        ]
-        
-        for exp_type in experience_types:
-            group_box = QGroupBox(exp_type)
-            group_box.setStyleSheet("""
-                QGroupBox {
-                    font-weight: bold;
-                    border: 1px solid #bdc3c7;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px 0 5px;
-                }
-            """)
-            group_box_layout = QHBoxLayout(group_box)
-            
-            year_label = QLabel("Year Started:")
-            year_input = QLineEdit()
-            year_input.setObjectName(f"asset_experience_{exp_type.lower().replace(' ', '_').replace('(', '').replace(')', '')}_year")
-            year_input.setPlaceholderText("YYYY")
-            year_input.setMaximumWidth(80)
-            year_input.setStyleSheet("""
-                QLineEdit {
-                    padding: 5px;
-                    border: 1px solid #bdc3c7;
-                    border-radius: 3px;
-                }
-            """)
-            
-            level_label = QLabel("Level:")
-            level_combo = QComboBox()
-            level_combo.setObjectName(f"asset_experience_{exp_type.lower().replace(' ', '_').replace('(', '').replace(')', '')}_level")
-            level_combo.addItems(["", "None", "Limited", "Good", "Extensive"])
-            level_combo.setStyleSheet("""
-                QComboBox {
-                    padding: 5px;
-                    border: 1px solid #bdc3c7;
-                    border-radius: 3px;
-                }
-            """)
-            
-            group_box_layout.addWidget(year_label)
-            group_box_layout.addWidget(year_input)
-            group_box_layout.addWidget(level_label)
-            group_box_layout.addWidget(level_combo)
-            group_box_layout.addStretch()
-            
-            self.asset_experience_fields[exp_type] = {"year": year_input, "level": level_combo}
-            self.asset_experience_layout.addWidget(group_box)
-            
-        experience_scroll.setWidget(experience_widget)
-        content_layout.addWidget(experience_scroll)
+        # One table row per asset type: year started and experience level
+        content_layout.addWidget(self.create_field_table(ASSET_EXPERIENCE_COLUMNS, ASSET_EXPERIENCE_FIELDS))
         
         # Outside Broker Firm
         has_outside_broker_checkbox = QCheckBox("Do you have assets with an outside broker firm?")
@@ -1152,30 +1126,7 @@ class MagnusClientIntakeForm(QMainWindow):
         
         outside_broker_layout = QVBoxLayout(self.outside_broker_group)
         
-        outside_broker_layout.addWidget(QLabel("Firm Name:"))
-        outside_firm_name_input = EnhancedLineEdit("outside_firm_name")
-        outside_firm_name_input.setObjectName("outside_firm_name")
-        outside_broker_layout.addWidget(outside_firm_name_input)
-        
-        outside_broker_layout.addWidget(QLabel("Account Type:"))
-        outside_account_type_input = QComboBox()
-        outside_account_type_input.setObjectName("outside_broker_account_type")
-        outside_account_type_input.addItems([
-            "", "Individual", "Joint", "IRA", "Roth IRA", 
-            "401(k)", "Trust", "Other"
-        ])
-        outside_broker_layout.addWidget(outside_account_type_input)
-        
-        outside_broker_layout.addWidget(QLabel("Account Number:"))
-        outside_account_number_input = EnhancedLineEdit("outside_broker_account_number")
-        outside_account_number_input.setObjectName("outside_broker_account_number")
-        outside_broker_layout.addWidget(outside_account_number_input)
-        
-        outside_broker_layout.addWidget(QLabel("Liquid Amount with this Firm:"))
-        outside_liquid_amount_input = EnhancedLineEdit("outside_liquid_amount")
-        outside_liquid_amount_input.setObjectName("outside_liquid_amount")
-        outside_liquid_amount_input.setPlaceholderText("Enter liquid amount in USD")
-        outside_broker_layout.addWidget(outside_liquid_amount_input)
+        self.add_fields(outside_broker_layout, OUTSIDE_BROKER_FIELDS)
         
         content_layout.addWidget(self.outside_broker_group)
         
@@ -1186,7 +1137,7 @@ class MagnusClientIntakeForm(QMainWindow):
         # Navigation buttons
         layout.addLayout(self.create_navigation_buttons(back_index=7, next_index=9))
         
-        self.stacked_widget.addWidget(widget)
+        return widget
         
     def on_include_breakdown_changed(self, state):
         """Handle include breakdown checkbox change"""
@@ -1200,80 +1151,32 @@ class MagnusClientIntakeForm(QMainWindow):
         
     def create_trusted_contact_page(self):
         """Create the trusted contact person page"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        # Page title
-        title = QLabel("Trusted Contact Person")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
-        layout.addWidget(title)
-        
-        # Instructions
-        instructions = QLabel("""
-        Please provide information for a trusted contact person. This person may be contacted 
-        in the event we are unable to reach you, or if we have concerns about your health 
-        or financial exploitation.
-        """)
-        instructions.setWordWrap(True)
-        instructions.setStyleSheet("font-style: italic; color: #7f8c8d; margin-bottom: 15px;")
-        layout.addWidget(instructions)
-        
-        # Trusted Contact Name
-        layout.addWidget(QLabel("Full Legal Name:"))
-        trusted_name_input = EnhancedLineEdit("trusted_full_name")
-        trusted_name_input.setObjectName("trusted_full_name")
-        layout.addWidget(trusted_name_input)
-        
-        # Trusted Contact Relationship
-        layout.addWidget(QLabel("Relationship to You:"))
-        trusted_relationship_input = EnhancedLineEdit("trusted_relationship")
-        trusted_relationship_input.setObjectName("trusted_relationship")
-        layout.addWidget(trusted_relationship_input)
-        
-        # Trusted Contact Phone
-        layout.addWidget(QLabel("Phone Number:"))
-        trusted_phone_input = EnhancedLineEdit("trusted_phone")
-        trusted_phone_input.setObjectName("trusted_phone")
-        trusted_phone_input.setPlaceholderText("(XXX) XXX-XXXX")
-        layout.addWidget(trusted_phone_input)
-        
-        # Trusted Contact Email
-        layout.addWidget(QLabel("Email Address:"))
-        trusted_email_input = EnhancedLineEdit("trusted_email")
-        trusted_email_input.setObjectName("trusted_email")
-        trusted_email_input.setPlaceholderText("example@email.com")
-        layout.addWidget(trusted_email_input)
-        
-        layout.addStretch()
-        layout.addLayout(self.create_navigation_buttons(back_index=8, next_index=10))
-        
-        self.stacked_widget.addWidget(widget)
+        return self.create_form_page(
+            "Trusted Contact Person", TRUSTED_CONTACT_FIELDS,
+            back_index=8, next_index=10, instructions=TRUSTED_CONTACT_INSTRUCTIONS
+        )
         
     def create_regulatory_page(self):
         """Create the regulatory consent page"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
-        # Page title
-        title = QLabel("Regulatory Consent")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
-        layout.addWidget(title)
+        self.create_page_title(layout, "Regulatory Consent")
         
         # Electronic Delivery Consent
         layout.addWidget(QLabel("Electronic Delivery Consent:"))
         
-        reg_group = QButtonGroup()
+        # Kept on self and parented to the page so the group outlives this method
+        self.regulatory_group = QButtonGroup(widget)
         
         reg_yes = QRadioButton("Yes - I consent to receive regulatory communications electronically")
         reg_yes.setObjectName("electronic_regulatory_yes")
-        reg_group.addButton(reg_yes)
+        self.regulatory_group.addButton(reg_yes)
         layout.addWidget(reg_yes)
         
         reg_no = QRadioButton("No - I prefer to receive regulatory communications by mail")
         reg_no.setObjectName("electronic_regulatory_no")
-        reg_group.addButton(reg_no)
+        self.regulatory_group.addButton(reg_no)
         layout.addWidget(reg_no)
         
         # Disclosure text
@@ -1291,96 +1194,52 @@ class MagnusClientIntakeForm(QMainWindow):
         System Requirements: You must have access to a computer with internet 
         connection and email capability to receive electronic communications.
         """)
+        disclosure.setObjectName("disclosure")
         disclosure.setWordWrap(True)
-        disclosure.setStyleSheet("""
-            QLabel {
-                background-color: #f8f9fa;
-                padding: 15px;
-                border-radius: 5px;
-                font-size: 11px;
-                line-height: 1.4;
-                border: 1px solid #dee2e6;
-            }
-        """)
         layout.addWidget(disclosure)
         
         layout.addStretch()
         layout.addLayout(self.create_navigation_buttons(back_index=9, next_index=11))
         
-        self.stacked_widget.addWidget(widget)
+        return widget
         
     def create_review_submit_page(self):
         """Create the review and submit page"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
-        # Page title
-        title = QLabel("Review & Submit")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
-        layout.addWidget(title)
+        self.create_page_title(layout, "Review & Submit")
         
         # Instructions
         instructions = QLabel("Please review your information and submit the form to generate your PDF report.")
-        instructions.setStyleSheet("font-style: italic; color: #7f8c8d; margin-bottom: 15px;")
+        instructions.setProperty("role", "instructions")
         layout.addWidget(instructions)
         
         # Review area
-        self.review_area = QTextEdit()
+        # Plain text only, so skip QTextEdit's rich text layout
+        self.review_area = QPlainTextEdit()
+        self.review_area.setObjectName("reviewArea")
         self.review_area.setReadOnly(True)
-        self.review_area.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 5px;
-                padding: 10px;
-                font-family: monospace;
-                font-size: 11px;
-            }
-        """)
+        self.review_area.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         layout.addWidget(self.review_area)
         
         # Action buttons
         button_layout = QHBoxLayout()
         
-        save_draft_btn = QPushButton("Save Draft")
-        save_draft_btn.clicked.connect(self.save_draft)
-        save_draft_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
-        button_layout.addWidget(save_draft_btn)
-        
-        generate_pdf_btn = QPushButton("Generate PDF Report")
-        generate_pdf_btn.clicked.connect(self.generate_pdf_report)
-        generate_pdf_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
-        button_layout.addWidget(generate_pdf_btn)
+        self.save_draft_btn = QPushButton("Save Draft")
+        self.save_draft_btn.clicked.connect(self.save_draft)
+        self.save_draft_btn.setProperty("kind", "secondary")
+        button_layout.addWidget(self.save_draft_btn)
+        
+        self.generate_pdf_btn = QPushButton("Generate PDF Report")
+        self.generate_pdf_btn.clicked.connect(self.generate_pdf_report)
+        self.generate_pdf_btn.setProperty("kind", "success")
+        button_layout.addWidget(self.generate_pdf_btn)
         
         layout.addLayout(button_layout)
         layout.addLayout(self.create_navigation_buttons(back_index=10, next_index=None))
         
-        self.stacked_widget.addWidget(widget)
+        return widget
         
     def create_navigation_buttons(self, back_index=None, next_index=None):
         """Create navigation buttons layout"""
@@ -1388,294 +1247,252 @@ class MagnusClientIntakeForm(QMainWindow):
         
         if back_index is not None:
             back_btn = QPushButton("← Back")
-            back_btn.clicked.connect(lambda: self.navigate_to_page(back_index))
-            back_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #6c757d;
-                    color: white;
-                    border: none;
-                    padding: 10px 20px;
-                    border-radius: 5px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #5a6268;
-                }
-            """)
+            back_btn.setObjectName("navBack")
+            back_btn.setProperty("kind", "secondary")
+            back_btn.clicked.connect(partial(self.navigate_to_page, back_index))
             layout.addWidget(back_btn)
         
         layout.addStretch()
         
         if next_index is not None:
             next_btn = QPushButton("Next →")
-            next_btn.clicked.connect(lambda: self.navigate_to_page(next_index))
-            next_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #007bff;
-                    color: white;
-                    border: none;
-                    padding: 10px 20px;
-                    border-radius: 5px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #0056b3;
-                }
-            """)
+            next_btn.setObjectName("navNext")
+            next_btn.setProperty("kind", "primary")
+            next_btn.clicked.connect(partial(self.navigate_to_page, next_index))
             layout.addWidget(next_btn)
         
         return layout
         
+    def ensure_page_built(self, page_index):
+        """Replace the placeholder at page_index with the real page on first use"""
+        builder = self._page_builders.pop(page_index, None)
+        if builder is None:
+            return
+        
+        # Build, swap in and fill the page as one batch: no repaints of the
+        # half-built page and no stack signals for the placeholder swap
+        self.stacked_widget.setUpdatesEnabled(False)
+        with QSignalBlocker(self.stacked_widget):
+            page = builder()
+            placeholder = self.stacked_widget.widget(page_index)
+            self.stacked_widget.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.stacked_widget.insertWidget(page_index, page)
+        
+        # Register the page's fields, restore any loaded draft values, then
+        # track edits so the review text is rebuilt
+        fields = self.register_fields(page)
+        self.populate_form_fields(fields)
+        self.stacked_widget.setUpdatesEnabled(True)
+        self.track_changes(fields)
+        
     def navigate_to_page(self, page_index):
         """Navigate to a specific page"""
+        self.ensure_page_built(page_index)
+        
         if page_index == 11:  # Review page
             self.update_review_area()
         
+        # Switch page, progress and status together and repaint once
+        self.setUpdatesEnabled(False)
         self.current_page = page_index
         self.stacked_widget.setCurrentIndex(page_index)
-        self.progress_bar.setValue(page_index + 1)
+        with QSignalBlocker(self.progress_bar):
+            self.progress_bar.setValue(page_index + 1)
         self.statusBar().showMessage(f"Page {page_index + 1} of 12")
-        
-        # Auto-save when navigating
-        self.collect_form_data()
+        self.setUpdatesEnabled(True)
+        # Collection is deliberately left to the review, draft and PDF paths,
+        # which each collect the form data before using it
         
     def update_review_area(self):
         """Update the review area with current form data"""
+        if not self._review_dirty:
+            return
         self.collect_form_data()
         
-        review_text = "=== MAGNUS CLIENT INTAKE FORM - REVIEW ===\n\n"
+        # Collect the text in pieces and join once at the end
+        parts = ["=== MAGNUS CLIENT INTAKE FORM - REVIEW ===\n\n"]
+        
+        # Bound once; the sections below look up and append dozens of fields
+        get = self.form_data.get
+        add = parts.append
         
-        # Helper to format fields
-        def format_field(label, value):
-            return f"  {label}: {value if value else '[Not provided]'}\n"
-
         # Personal Information
-        review_text += "PERSONAL INFORMATION:\n"
-        review_text += format_field("Full Name", self.form_data.get("full_name"))
-        review_text += format_field("Date of Birth", self.form_data.get("dob"))
-        review_text += format_field("Social Security Number", self.form_data.get("ssn"))
-        review_text += format_field("Citizenship", self.form_data.get("citizenship"))
-        review_text += format_field("Marital Status", self.form_data.get("marital_status"))
-        review_text += "\n"
+        add("PERSONAL INFORMATION:\n")
+        add(format_review_field("Full Name", get("full_name")))
+        add(format_review_field("Date of Birth", get("dob")))
+        add(format_review_field("Social Security Number", get("ssn")))
+        add(format_review_field("Citizenship", get("citizenship")))
+        add(format_review_field("Marital Status", get("marital_status")))
+        add("\n")
 
         # Contact Information
-        review_text += "CONTACT INFORMATION:\n"
-        review_text += format_field("Residential Address", self.form_data.get("residential_address"))
-        if self.form_data.get("mailing_address_different"):
-            review_text += format_field("Mailing Address", self.form_data.get("mailing_address"))
-        review_text += format_field("Email", self.form_data.get("email"))
-        review_text += format_field("Home Phone", self.form_data.get("home_phone"))
-        review_text += format_field("Mobile Phone", self.form_data.get("mobile_phone"))
-        review_text += format_field("Work Phone", self.form_data.get("work_phone"))
-        review_text += "\n"
+        add("CONTACT INFORMATION:\n")
+        add(format_review_field("Residential Address", get("residential_address")))
+        if get("mailing_address_different"):
+            add(format_review_field("Mailing Address", get("mailing_address")))
+        add(format_review_field("Email", get("email")))
+        add(format_review_field("Home Phone", get("home_phone")))
+        add(format_review_field("Mobile Phone", get("mobile_phone")))
+        add(format_review_field("Work Phone", get("work_phone")))
+        add("\n")
 
         # Employment Information
-        review_text += "EMPLOYMENT INFORMATION:\n"
-        review_text += format_field("Employment Status", self.form_data.get("employment_status"))
-        review_text += format_field("Employer Name", self.form_data.get("employer_name"))
-        review_text += format_field("Occupation", self.form_data.get("occupation"))
-        review_text += format_field("Years Employed", self.form_data.get("years_employed"))
-        review_text += format_field("Annual Income", self.form_data.get("annual_income"))
-        review_text += format_field("Employer Address", self.form_data.get("employer_address"))
-        review_text += "\n"
+        add("EMPLOYMENT INFORMATION:\n")
+        add(format_review_field("Employment Status", get("employment_status")))
+        add(format_review_field("Employer Name", get("employer_name")))
+        add(format_review_field("Occupation", get("occupation")))
+        add(format_review_field("Years Employed", get("years_employed")))
+        add(format_review_field("Annual Income", get("annual_income")))
+        add(format_review_field("Employer Address", get("employer_address")))
+        add("\n")
 
         # Retirement Information
-        if self.form_data.get("employment_status") == "Retired":
-            review_text += "RETIREMENT INFORMATION:\n"
-            review_text += format_field("Former Employer", self.form_data.get("former_employer"))
-            review_text += format_field("Source of Income", self.form_data.get("income_source"))
-            review_text += "\n"
+        if get("employment_status") == "Retired":
+            add("RETIREMENT INFORMATION:\n")
+            add(format_review_field("Former Employer", get("former_employer")))
+            add(format_review_field("Source of Income", get("income_source")))
+            add("\n")
 
         # Financial Information
-        review_text += "FINANCIAL INFORMATION:\n"
-        review_text += format_field("Education Status", self.form_data.get("education_status"))
-        review_text += format_field("Estimated Tax Bracket", self.form_data.get("tax_bracket"))
-        review_text += format_field("Investment Risk Tolerance", self.form_data.get("risk_tolerance"))
-        review_text += format_field("Investment Purpose", self.form_data.get("investment_purpose"))
-        review_text += format_field("Investment Objectives", self.form_data.get("investment_objective"))
-        review_text += format_field("Net Worth (excluding primary home)", self.form_data.get("net_worth"))
-        review_text += format_field("Liquid Net Worth", self.form_data.get("liquid_net_worth"))
-        review_text += format_field("Assets Held Away", self.form_data.get("assets_held_away"))
-        review_text += "\n"
+        add("FINANCIAL INFORMATION:\n")
+        add(format_review_field("Education Status", get("education_status")))
+        add(format_review_field("Estimated Tax Bracket", get("tax_bracket")))
+        add(format_review_field("Investment Risk Tolerance", get("risk_tolerance")))
+        add(format_review_field("Investment Purpose", get("investment_purpose")))
+        add(format_review_field("Investment Objectives", get("investment_objective")))
+        add(format_review_field("Net Worth (excluding primary home)", get("net_worth")))
+        add(format_review_field("Liquid Net Worth", get("liquid_net_worth")))
+        add(format_review_field("Assets Held Away", get("assets_held_away")))
+        add("\n")
 
         # Spouse Information
-        if not self.form_data.get("spouse_applicable"):
-            review_text += "SPOUSE INFORMATION:\n"
-            review_text += format_field("Spouse Full Name", self.form_data.get("spouse_full_name"))
-            review_text += format_field("Spouse Date of Birth", self.form_data.get("spouse_dob"))
-            review_text += format_field("Spouse SSN", self.form_data.get("spouse_ssn"))
-            review_text += format_field("Spouse Employment Status", self.form_data.get("spouse_employment_status"))
-            review_text += format_field("Spouse Employer Name", self.form_data.get("spouse_employer_name"))
-            review_text += format_field("Spouse Occupation/Title", self.form_data.get("spouse_occupation"))
-            review_text += "\n"
+        if not get("spouse_applicable"):
+            add("SPOUSE INFORMATION:\n")
+            add(format_review_field("Spouse Full Name", get("spouse_full_name")))
+            add(format_review_field("Spouse Date of Birth", get("spouse_dob")))
+            add(format_review_field("Spouse SSN", get("spouse_ssn")))
+            add(format_review_field("Spouse Employment Status", get("spouse_employment_status")))
+            add(format_review_field("Spouse Employer Name", get("spouse_employer_name")))
+            add(format_review_field("Spouse Occupation/Title", get("spouse_occupation")))
+            add("\n")
         else:
-            review_text += "SPOUSE INFORMATION:\n  [Not applicable]\n\n"
+            add("SPOUSE INFORMATION:\n  [Not applicable]\n\n")
 
         # Dependents
-        review_text += "DEPENDENTS:\n"
-        dependents = self.form_data.get("dependents", [])
+        add("DEPENDENTS:\n")
+        dependents = get("dependents")
         if dependents:
-            for i, dep in enumerate(dependents):
-                review_text += f"  Dependent {i+1}:\n"
-                review_text += format_field("    Name", dep.get("name"))
-                review_text += format_field("    Date of Birth", dep.get("dob"))
-                review_text += format_field("    Relationship", dep.get("relationship"))
+            for i, dep in enumerate(dependents, 1):
+                add(
+                    f"  Dependent {i}:\n"
+                    f"      Name: {dep.get('name') or '[Not provided]'}\n"
+                    f"      Date of Birth: {dep.get('dob') or '[Not provided]'}\n"
+                    f"      Relationship: {dep.get('relationship') or '[Not provided]'}\n"
+                )
         else:
-            review_text += "  [No dependents specified]\n"
-        review_text += "\n"
+            add("  [No dependents specified]\n")
+        add("\n")
 
         # Beneficiaries
-        review_text += "BENEFICIARIES:\n"
-        beneficiaries = self.form_data.get("beneficiaries", [])
+        add("BENEFICIARIES:\n")
+        beneficiaries = get("beneficiaries")
         if beneficiaries:
-            for i, ben in enumerate(beneficiaries):
-                review_text += f"  Beneficiary {i+1}:\n"
-                review_text += format_field("    Name", ben.get("name"))
-                review_text += format_field("    Date of Birth", ben.get("dob"))
-                review_text += format_field("    Relationship", ben.get("relationship"))
-                percentage = ben.get('percentage', '')
-                review_text += format_field("    Percentage", f"{percentage}%" if percentage else "[Not provided]")
+            for i, ben in enumerate(beneficiaries, 1):
+                percentage = ben.get('percentage')
+                add(
+                    f"  Beneficiary {i}:\n"
+                    f"      Name: {ben.get('name') or '[Not provided]'}\n"
+                    f"      Date of Birth: {ben.get('dob') or '[Not provided]'}\n"
+                    f"      Relationship: {ben.get('relationship') or '[Not provided]'}\n"
+                    f"      Percentage: {f'{percentage}%' if percentage else '[Not provided]'}\n"
+                )
         else:
-            review_text += "  [No beneficiaries specified]\n"
-        review_text += "\n"
+            add("  [No beneficiaries specified]\n")
+        add("\n")
 
         # Asset Breakdown
-        review_text += "ASSET BREAKDOWN:\n"
-        asset_types = ["Stocks", "Bonds", "Mutual Funds", "ETFs", "Options", "Futures", "Short-Term", "Other"]
-        for asset_type in asset_types:
-            field_name = f"asset_breakdown_{asset_type.lower().replace(' ', '_')}"
-            value = self.form_data.get(field_name)
-            review_text += format_field(asset_type, f"{value}%" if value else None)
-        review_text += "\n"
+        add("ASSET BREAKDOWN:\n")
+        for asset_type, field_name in ASSET_BREAKDOWN_FIELDS:
+            value = get(field_name)
+            add(format_review_field(asset_type, f"{value}%" if value else None))
+        add("\n")
 
         # Investment Experience
-        review_text += "INVESTMENT EXPERIENCE:\n"
-        experience_types = ["Stocks", "Bonds", "Mutual Funds", "ETFs", "Options", "Futures"]
-        for exp_type in experience_types:
-            year_field = f"asset_experience_{exp_type.lower().replace(' ', '_')}_year"
-            level_field = f"asset_experience_{exp_type.lower().replace(' ', '_')}_level"
-            
-            year = self.form_data.get(year_field)
-            level = self.form_data.get(level_field)
+        add("INVESTMENT EXPERIENCE:\n")
+        for exp_type, year_field, level_field in ASSET_EXPERIENCE_FIELDS:
+            year = get(year_field)
+            level = get(level_field)
             
-            review_text += f"  {exp_type}:\n"
-            review_text += format_field("    Year Started", year)
-            review_text += format_field("    Experience Level", level)
-        review_text += "\n"
+            add(f"  {exp_type}:\n")
+            add(format_review_field("    Year Started", year))
+            add(format_review_field("    Experience Level", level))
+        add("\n")
 
         # Outside Broker Information
-        if self.form_data.get("has_outside_broker"):
-            review_text += "OUTSIDE BROKER INFORMATION:\n"
-            review_text += format_field("Broker Firm Name", self.form_data.get("outside_firm_name"))
-            review_text += format_field("Account Number", self.form_data.get("outside_broker_account_number"))
-            review_text += format_field("Account Type", self.form_data.get("outside_broker_account_type"))
-            review_text += "\n"
+        if get("has_outside_broker"):
+            add("OUTSIDE BROKER INFORMATION:\n")
+            add(format_review_field("Broker Firm Name", get("outside_firm_name")))
+            add(format_review_field("Account Number", get("outside_broker_account_number")))
+            add(format_review_field("Account Type", get("outside_broker_account_type")))
+            add("\n")
 
         # Trusted Contact Information
-        review_text += "TRUSTED CONTACT INFORMATION:\n"
-        review_text += format_field("Full Name", self.form_data.get("trusted_full_name"))
-        review_text += format_field("Relationship", self.form_data.get("trusted_relationship"))
-        review_text += format_field("Phone Number", self.form_data.get("trusted_phone"))
-        review_text += format_field("Email Address", self.form_data.get("trusted_email"))
-        review_text += "\n"
+        add("TRUSTED CONTACT INFORMATION:\n")
+        add(format_review_field("Full Name", get("trusted_full_name")))
+        add(format_review_field("Relationship", get("trusted_relationship")))
+        add(format_review_field("Phone Number", get("trusted_phone")))
+        add(format_review_field("Email Address", get("trusted_email")))
+        add("\n")
 
         # Regulatory Consent
-        review_text += "REGULATORY CONSENT:\n"
-        electronic_consent = "Yes" if self.form_data.get("electronic_regulatory_yes") else "No"
-        review_text += format_field("Electronic Delivery Consent", electronic_consent)
-        review_text += "\n"
-        
-        self.review_area.setPlainText(review_text)
+        add("REGULATORY CONSENT:\n")
+        electronic_consent = "Yes" if get("electronic_regulatory_yes") else "No"
+        add(format_review_field("Electronic Delivery Consent", electronic_consent))
+        add("\n")
+        
+        self.review_area.setPlainText("".join(parts))
+        self._review_dirty = False
+        
+    def register_fields(self, root):
+        """Add the named input widgets under root to the field registry"""
+        fields = {}
+        for widget in root.findChildren(INPUT_WIDGET_TYPES):
+            object_name = widget.objectName()
+            if object_name and not object_name.startswith("qt_") and object_name not in self._fields:
+                fields[object_name] = widget
+                self._field_readers[object_name] = (widget, field_getter(widget))
+                self._field_writers[object_name] = (widget, field_setter(widget))
+        self._fields.update(fields)
+        return fields
         
     def collect_form_data(self):
         """Collect all form data from the UI"""
-        # Get all widgets with object names
-        for widget in self.findChildren((QLineEdit, QComboBox, QDateEdit, QTextEdit, QSpinBox, QCheckBox, QRadioButton)):
-            object_name = widget.objectName()
-            if object_name:
-                if isinstance(widget, QLineEdit):
-                    self.form_data[object_name] = widget.text()
-                elif isinstance(widget, QComboBox):
-                    self.form_data[object_name] = widget.currentText()
-                elif isinstance(widget, QDateEdit):
-                    self.form_data[object_name] = widget.date().toString("MM/dd/yyyy")
-                elif isinstance(widget, QTextEdit):
-                    self.form_data[object_name] = widget.toPlainText()
-                elif isinstance(widget, QSpinBox):
-                    self.form_data[object_name] = widget.value()
-                elif isinstance(widget, QCheckBox):
-                    self.form_data[object_name] = widget.isChecked()
-                elif isinstance(widget, QRadioButton):
-                    if widget.isChecked():
-                        self.form_data[object_name] = True
-
-        # Collect investment purpose data
-        investment_purposes = []
-        for purpose, checkbox in self.purpose_checkboxes.items():
-            if checkbox.isChecked():
-                investment_purposes.append(purpose)
-        self.form_data["investment_purpose"] = ", ".join(investment_purposes) if investment_purposes else None
-
-        # Collect investment objectives data
-        investment_objectives = []
-        for objective, spinbox in self.objective_spinboxes.items():
-            rank = spinbox.value()
-            if rank > 0:  # Only include if a rank is selected
-                investment_objectives.append(f"{objective}: {rank}")
-        self.form_data["investment_objective"] = "\n".join(investment_objectives) if investment_objectives else None
-
-        # Collect dependents data
-        dependents = []
-        for i in range(self.dependents_layout.count()):
-            frame = self.dependents_layout.itemAt(i).widget()
-            if isinstance(frame, QFrame):
-                dependent_data = {}
-                for child in frame.findChildren((QLineEdit, QDateEdit)):
-                    if isinstance(child, QLineEdit):
-                        if "name" in child.objectName():
-                            dependent_data["name"] = child.text()
-                        elif "relationship" in child.objectName():
-                            dependent_data["relationship"] = child.text()
-                    elif isinstance(child, QDateEdit):
-                        dependent_data["dob"] = child.date().toString("MM/dd/yyyy")
-                if dependent_data:
-                    dependents.append(dependent_data)
-        self.form_data["dependents"] = dependents
-
-        # Collect beneficiaries data
-        beneficiaries = []
-        for i in range(self.beneficiaries_layout.count()):
-            frame = self.beneficiaries_layout.itemAt(i).widget()
-            if isinstance(frame, QFrame):
-                beneficiary_data = {}
-                for child in frame.findChildren((QLineEdit, QDateEdit, QSpinBox)):
-                    if isinstance(child, QLineEdit):
-                        if "name" in child.objectName():
-                            beneficiary_data["name"] = child.text()
-                        elif "relationship" in child.objectName():
-                            beneficiary_data["relationship"] = child.text()
-                    elif isinstance(child, QDateEdit):
-                        beneficiary_data["dob"] = child.date().toString("MM/dd/yyyy")
-                    elif isinstance(child, QSpinBox):
-                        beneficiary_data["percentage"] = child.value()
-                if beneficiary_data:
-                    beneficiaries.append(beneficiary_data)
-        self.form_data["beneficiaries"] = beneficiaries
-
-        # Collect asset breakdown data
-        if hasattr(self, 'asset_breakdown_fields'):
-            for asset_type, spin_box in self.asset_breakdown_fields.items():
-                field_name = f"asset_breakdown_{asset_type.lower().replace(' ', '_')}"
-                self.form_data[field_name] = spin_box.value()
-
-        # Collect investment experience data
-        if hasattr(self, 'asset_experience_fields'):
-            for exp_type, fields in self.asset_experience_fields.items():
-                year_field = f"asset_experience_{exp_type.lower().replace(' ', '_')}_year"
-                level_field = f"asset_experience_{exp_type.lower().replace(' ', '_')}_level"
-                self.form_data[year_field] = fields["year"].text()
-                self.form_data[level_field] = fields["level"].currentText()
+        # Read every registered field with its getter; no tree search or type checks
+        for object_name, (widget, getter) in self._field_readers.items():
+            self.form_data[object_name] = getter(widget)
+
+        # Summaries of the purpose check boxes and objective ranks just read
+        self.form_data["investment_purpose"] = investment_purpose_text(self.form_data)
+        self.form_data["investment_objective"] = investment_objective_text(self.form_data)
+
+        # Collect dependents and beneficiaries data
+        for key, model in self._row_models.items():
+            self.form_data[key] = [dict(row) for row in model.rows]
+        for model in self._field_models:
+            model.store(self.form_data)
                         
+    def track_changes(self, fields):
+        """Connect change signals of the given fields to mark_dirty"""
+        for widget in fields.values():
+            signal_name = lookup_widget_class(FIELD_CHANGE_SIGNALS, widget)
+            if signal_name:
+                getattr(widget, signal_name).connect(self.mark_dirty)
+                
+    def mark_dirty(self, *args):
+        """Flag the review text as out of date"""
+        self._review_dirty = True
+        
     def auto_save_data(self):
         """Auto-save form data"""
         # Removed auto-save functionality to prevent JSON format saving
@@ -1684,278 +1501,148 @@ class MagnusClientIntakeForm(QMainWindow):
     def load_draft_data(self):
         """Load draft data if available"""
         try:
-            temp_file = os.path.join(tempfile.gettempdir(), "magnus_form_autosave.json")
-            if os.path.exists(temp_file):
-                with open(temp_file, 'r') as f:
-                    self.form_data = json.load(f)
+            if os.path.exists(AUTOSAVE_PATH):
+                with open(AUTOSAVE_PATH, 'rb') as f:
+                    raw = f.read()
+                self.form_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 self.populate_form_fields()
         except Exception as e:
             print(f"Failed to load draft: {e}")
             
-    def populate_form_fields(self):
-        """Populate form fields with loaded data"""
-        for object_name, value in self.form_data.items():
-            widget = self.findChild((QLineEdit, QComboBox, QDateEdit, QTextEdit, QSpinBox, QCheckBox, QRadioButton), object_name)
-            if widget:
-                try:
-                    if isinstance(widget, QLineEdit):
-                        widget.setText(str(value))
-                    elif isinstance(widget, QComboBox):
-                        index = widget.findText(str(value))
-                        if index >= 0:
-                            widget.setCurrentIndex(index)
-                    elif isinstance(widget, QDateEdit):
-                        widget.setDate(QDate.fromString(str(value), "MM/dd/yyyy"))
-                    elif isinstance(widget, QTextEdit):
-                        widget.setPlainText(str(value))
-                    elif isinstance(widget, QSpinBox):
-                        if value:
-                            widget.setValue(int(value))
-                    elif isinstance(widget, QCheckBox):
-                        widget.setChecked(bool(value))
-                    elif isinstance(widget, QRadioButton):
-                        widget.setChecked(bool(value))
-                except Exception as e:
-                    print(f"Failed to populate field {object_name}: {e}")
+    def populate_form_fields(self, fields=None):
+        """Populate the given fields (every registered field by default) with loaded data"""
+        if fields is None:
+            fields = self._fields
+        
+        # Only names that are both on screen and in the draft need restoring
+        form_data = self.form_data
+        restored = fields.keys() & form_data.keys()
+        for object_name in restored:
+            widget, setter = self._field_writers[object_name]
+            try:
+                with QSignalBlocker(widget):
+                    setter(widget, form_data[object_name])
+            except Exception as e:
+                print(f"Failed to populate field {object_name}: {e}")
+                
+        # Signals were blocked, so apply each show/enable handler once now
+        for object_name in restored & DEPENDENT_SECTION_HANDLERS.keys():
+            handler_name, read_argument = DEPENDENT_SECTION_HANDLERS[object_name]
+            getattr(self, handler_name)(read_argument(self._fields[object_name]))
                     
     def save_draft(self):
-        """Save current form as draft in Word format"""
+        """Save current form as draft in Word format on a worker thread"""
         self.collect_form_data()
         
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Save Draft", "magnus_form_draft.docx", "Word Files (*.docx)"
         )
         
-        if file_path:
-            try:
-                doc = Document()
-                
-                # Title
-                title = doc.add_heading('Magnus Client Intake Form', 0)
-                title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                
-                # Helper function to format monetary values
-                def format_money(value):
-                    if value:
-                        try:
-                            return f"${int(value):,}"
-                        except ValueError:
-                            return value
-                    return "[Not provided]"
-                
-                # Personal Information
-                doc.add_heading('Personal Information', level=1)
-                doc.add_paragraph(f"Full Name: {self.form_data.get('full_name', '[Not provided]')}")
-                doc.add_paragraph(f"Date of Birth: {self.form_data.get('dob', '[Not provided]')}")
-                doc.add_paragraph(f"Social Security Number: {self.form_data.get('ssn', '[Not provided]')}")
-                doc.add_paragraph(f"Citizenship: {self.form_data.get('citizenship', '[Not provided]')}")
-                doc.add_paragraph(f"Marital Status: {self.form_data.get('marital_status', '[Not provided]')}")
-                doc.add_paragraph()
-                
-                # Contact Information
-                doc.add_heading('Contact Information', level=1)
-                doc.add_paragraph(f"Residential Address: {self.form_data.get('residential_address', '[Not provided]')}")
-                doc.add_paragraph(f"Email: {self.form_data.get('email', '[Not provided]')}")
-                doc.add_paragraph(f"Home Phone: {self.form_data.get('home_phone', '[Not provided]')}")
-                doc.add_paragraph(f"Mobile Phone: {self.form_data.get('mobile_phone', '[Not provided]')}")
-                doc.add_paragraph(f"Work Phone: {self.form_data.get('work_phone', '[Not provided]')}")
-                doc.add_paragraph()
-                
-                # Employment Information
-                doc.add_heading('Employment Information', level=1)
-                doc.add_paragraph(f"Employment Status: {self.form_data.get('employment_status', '[Not provided]')}")
-                doc.add_paragraph(f"Employer Name: {self.form_data.get('employer_name', '[Not provided]')}")
-                doc.add_paragraph(f"Occupation: {self.form_data.get('occupation', '[Not provided]')}")
-                doc.add_paragraph(f"Years Employed: {self.form_data.get('years_employed', '[Not provided]')}")
-                doc.add_paragraph(f"Annual Income: {format_money(self.form_data.get('annual_income'))}")
-                
-                # Retirement Information (if applicable)
-                if self.form_data.get('employment_status') == 'Retired':
-                    doc.add_heading('Retirement Information', level=1)
-                    doc.add_paragraph(f"Former Employer: {self.form_data.get('former_employer', '[Not provided]')}")
-                    doc.add_paragraph(f"Source of Income: {self.form_data.get('income_source', '[Not provided]')}")
-                doc.add_paragraph()
-                
-                # Financial Information
-                doc.add_heading('Financial Information', level=1)
-                doc.add_paragraph(f"Education Status: {self.form_data.get('education_status', '[Not provided]')}")
-                doc.add_paragraph(f"Estimated Tax Bracket: {self.form_data.get('tax_bracket', '[Not provided]')}")
-                doc.add_paragraph(f"Investment Risk Tolerance: {self.form_data.get('risk_tolerance', '[Not provided]')}")
-                
-                # Investment Purpose
-                doc.add_paragraph("Investment Purpose:")
-                purpose_list = []
-                for purpose in ["Income", "Growth and Income", "Capital Appreciation", "Speculation"]:
-                    if self.form_data.get(f"investment_purpose_{purpose.lower().replace(' ', '_')}"):
-                        purpose_list.append(purpose)
-                doc.add_paragraph(", ".join(purpose_list) if purpose_list else "[Not provided]")
-                
-                # Investment Objectives
-                doc.add_paragraph("Investment Objectives (Ranked 1-5):")
-                objectives = [
-                    "Trading Profits", "Speculation", "Capital Appreciation", 
-                    "Income", "Preservation of Capital"
-                ]
-                for objective in objectives:
-                    rank = self.form_data.get(f"investment_objective_{objective.lower().replace(' ', '_')}")
-                    if rank:
-                        doc.add_paragraph(f"  {objective}: {rank}")
-                
-                doc.add_paragraph(f"Net Worth: {format_money(self.form_data.get('net_worth'))}")
-                doc.add_paragraph(f"Liquid Net Worth: {format_money(self.form_data.get('liquid_net_worth'))}")
-                doc.add_paragraph(f"Assets Held Away: {format_money(self.form_data.get('assets_held_away'))}")
-                doc.add_paragraph()
-                
-                # Spouse Information
-                if self.form_data.get('spouse_applicable'):
-                    doc.add_heading('Spouse Information', level=1)
-                    doc.add_paragraph(f"Full Name: {self.form_data.get('spouse_full_name', '[Not provided]')}")
-                    doc.add_paragraph(f"Date of Birth: {self.form_data.get('spouse_dob', '[Not provided]')}")
-                    doc.add_paragraph(f"Social Security Number: {self.form_data.get('spouse_ssn', '[Not provided]')}")
-                    doc.add_paragraph(f"Employment Status: {self.form_data.get('spouse_employment_status', '[Not provided]')}")
-                    doc.add_paragraph(f"Employer Name: {self.form_data.get('spouse_employer_name', '[Not provided]')}")
-                    doc.add_paragraph(f"Occupation: {self.form_data.get('spouse_occupation', '[Not provided]')}")
-                    doc.add_paragraph()
-                
-                # Dependents
-                doc.add_heading('Dependents', level=1)
-                dependents = self.form_data.get('dependents', [])
-                if dependents:
-                    for i, dep in enumerate(dependents, 1):
-                        doc.add_paragraph(f"Dependent {i}:")
-                        doc.add_paragraph(f"  Name: {dep.get('name', '[Not provided]')}")
-                        doc.add_paragraph(f"  Date of Birth: {dep.get('dob', '[Not provided]')}")
-                        doc.add_paragraph(f"  Relationship: {dep.get('relationship', '[Not provided]')}")
-                else:
-                    doc.add_paragraph("[No dependents specified]")
-                doc.add_paragraph()
-                
-                # Beneficiaries
-                doc.add_heading('Beneficiaries', level=1)
-                beneficiaries = self.form_data.get('beneficiaries', [])
-                if beneficiaries:
-                    for i, ben in enumerate(beneficiaries, 1):
-                        doc.add_paragraph(f"Beneficiary {i}:")
-                        doc.add_paragraph(f"  Name: {ben.get('name', '[Not provided]')}")
-                        doc.add_paragraph(f"  Date of Birth: {ben.get('dob', '[Not provided]')}")
-                        doc.add_paragraph(f"  Relationship: {ben.get('relationship', '[Not provided]')}")
-                        percentage = ben.get('percentage', '')
-                        doc.add_paragraph(f"  Percentage: {f'{percentage}%' if percentage else '[Not provided]'}")
-                else:
-                    doc.add_paragraph("[No beneficiaries specified]")
-                doc.add_paragraph()
-                
-                # Asset Breakdown
-                doc.add_heading('Asset Breakdown', level=1)
-                asset_types = [
-                    "Stocks", "Bonds", "Mutual Funds", "ETFs", "UITs", 
-                    "Annuities (Fixed)", "Annuities (Variable)", "Options", 
-                    "Commodities", "Alternative Investments", "Limited Partnerships", 
-                    "Variable Contracts", "Short-Term", "Other"
-                ]
-                for asset_type in asset_types:
-                    field_name = f"asset_breakdown_{asset_type.lower().replace(' ', '_').replace('(', '').replace(')', '')}"
-                    value = self.form_data.get(field_name)
-                    doc.add_paragraph(f"{asset_type}: {f'{value}%' if value else '[Not provided]'}")
-                doc.add_paragraph()
-                
-                # Investment Experience
-                doc.add_heading('Investment Experience', level=1)
-                experience_types = [
-                    "Stocks", "Bonds", "Mutual Funds", "UITs", 
-                    "Annuities (Fixed)", "Annuities (Variable)", "Options", 
-                    "Commodities", "Alternative Investments", "Limited Partnerships", 
-                    "Variable Contracts"
-                ]
-                for exp_type in experience_types:
-                    doc.add_paragraph(f"{exp_type}:")
-                    year_field = f"asset_experience_{exp_type.lower().replace(' ', '_').replace('(', '').replace(')', '')}_year"
-                    level_field = f"asset_experience_{exp_type.lower().replace(' ', '_').replace('(', '').replace(')', '')}_level"
-                    year = self.form_data.get(year_field)
-                    level = self.form_data.get(level_field)
-                    doc.add_paragraph(f"  Year Started: {year or '[Not provided]'}")
-                    doc.add_paragraph(f"  Experience Level: {level or '[Not provided]'}")
-                doc.add_paragraph()
-                
-                # Outside Broker Information
-                if self.form_data.get('has_outside_broker'):
-                    doc.add_heading('Outside Broker Information', level=1)
-                    doc.add_paragraph(f"Broker Firm Name: {self.form_data.get('outside_firm_name', '[Not provided]')}")
-                    doc.add_paragraph(f"Account Type: {self.form_data.get('outside_broker_account_type', '[Not provided]')}")
-                    doc.add_paragraph(f"Account Number: {self.form_data.get('outside_broker_account_number', '[Not provided]')}")
-                    doc.add_paragraph(f"Liquid Amount: {format_money(self.form_data.get('outside_liquid_amount'))}")
-                    doc.add_paragraph()
-                
-                # Trusted Contact Information
-                doc.add_heading('Trusted Contact Information', level=1)
-                doc.add_paragraph(f"Full Name: {self.form_data.get('trusted_full_name', '[Not provided]')}")
-                doc.add_paragraph(f"Relationship: {self.form_data.get('trusted_relationship', '[Not provided]')}")
-                doc.add_paragraph(f"Phone Number: {self.form_data.get('trusted_phone', '[Not provided]')}")
-                doc.add_paragraph(f"Email Address: {self.form_data.get('trusted_email', '[Not provided]')}")
-                doc.add_paragraph()
-                
-                # Regulatory Consent
-                doc.add_heading('Regulatory Consent', level=1)
-                electronic_consent = "Yes" if self.form_data.get('electronic_regulatory_yes') else "No"
-                doc.add_paragraph(f"Electronic Delivery Consent: {electronic_consent}")
-                
-                # Save the document
-                doc.save(file_path)
-                QMessageBox.information(self, "Success", "Draft saved successfully in Word format!")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save draft: {e}")
-                
+        if not file_path:  # User cancelled
+            return
+        
+        worker = DocumentWorker(partial(write_draft_document, self.draft_template()),
+                                copy.deepcopy(self.form_data), file_path)
+        worker.signals.finished.connect(self.on_draft_finished)
+        worker.signals.failed.connect(self.on_draft_failed)
+        self._draft_worker = worker
+        self.save_draft_btn.setEnabled(False)
+        self.statusBar().showMessage("Saving draft...")
+        QThreadPool.globalInstance().start(worker)
+        
+    def draft_template(self):
+        """Return the serialized blank draft, building it on first use"""
+        if self._draft_template is None:
+            from docx import Document
+            from docx.enum.text import WD_ALIGN_PARAGRAPH
+            
+            template = Document()
+            title = template.add_heading('Magnus Client Intake Form', 0)
+            title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            buffer = BytesIO()
+            template.save(buffer)
+            self._draft_template = buffer.getvalue()
+        return self._draft_template
+        
+    def on_draft_done(self):
+        """Re-enable draft saving once a worker has finished"""
+        self._draft_worker = None
+        self.save_draft_btn.setEnabled(True)
+        self.statusBar().showMessage(f"Page {self.current_page + 1} of 12")
+        
+    def on_draft_finished(self, file_path):
+        """Report a saved draft"""
+        self.on_draft_done()
+        QMessageBox.information(self, "Success", "Draft saved successfully in Word format!")
+        
+    def on_draft_failed(self, error):
+        """Report a failed draft save"""
+        self.on_draft_done()
+        QMessageBox.critical(self, "Error", f"Failed to save draft: {error}")
+        
     def generate_pdf_report(self):
-        """Generate a PDF report from the form data"""
-        try:
-            # First collect all form data
-            self.collect_form_data()
+        """Generate a PDF report from the form data on a worker thread"""
+        # First collect all form data
+        self.collect_form_data()
 
-            # Get the save location from user
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, "Save PDF Report", "magnus_form_report.pdf", "PDF Files (*.pdf)"
-            )
-            
-            if not file_path:  # User cancelled
-                return
-            
-            # Generate the PDF
-            from pdf_generator_reportlab import generate_pdf_report
-            success = generate_pdf_report(self.form_data, file_path)
-            
-            if success:
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"PDF has been generated successfully and saved to:\n{file_path}"
-                )
-                # Try to open the PDF
-                try:
-                    if os.name == 'nt':  # Windows
-                        os.startfile(file_path)
-                    elif os.name == 'posix':  # macOS or Linux
-                        subprocess.run(['open' if sys.platform == 'darwin' else 'xdg-open', file_path])
-                except Exception as e:
-                    QMessageBox.warning(
-                        self,
-                        "Warning",
-                        f"PDF was generated but could not be opened automatically:\n{str(e)}"
-                    )
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    "Failed to generate PDF. Please try again."
+        # Get the save location from user
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save PDF Report", "magnus_form_report.pdf", "PDF Files (*.pdf)"
+        )
+        
+        if not file_path:  # User cancelled
+            return
+        
+        # The worker renders a snapshot so later edits cannot race with it
+        worker = DocumentWorker(write_pdf_report, copy.deepcopy(self.form_data), file_path)
+        worker.signals.finished.connect(self.on_pdf_finished)
+        worker.signals.failed.connect(self.on_pdf_failed)
+        self._pdf_worker = worker
+        self.generate_pdf_btn.setEnabled(False)
+        self.statusBar().showMessage("Generating PDF report...")
+        QThreadPool.globalInstance().start(worker)
+        
+    def on_pdf_done(self):
+        """Re-enable PDF generation once a worker has finished"""
+        self._pdf_worker = None
+        self.generate_pdf_btn.setEnabled(True)
+        self.statusBar().showMessage(f"Page {self.current_page + 1} of 12")
+        
+    def on_pdf_finished(self, file_path):
+        """Report a generated PDF and try to open it"""
+        self.on_pdf_done()
+        QMessageBox.information(
+            self,
+            "Success",
+            f"PDF has been generated successfully and saved to:\n{file_path}"
+        )
+        # Try to open the PDF
+        try:
+            if os.name == 'nt':  # Windows
+                os.startfile(file_path)
+            elif os.name == 'posix':  # macOS or Linux
+                import subprocess
+                subprocess.Popen(
+                    ['open' if sys.platform == 'darwin' else 'xdg-open', file_path],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
                 )
         except Exception as e:
-            error_msg = f"An error occurred while generating the PDF:\n{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
-            print(error_msg)  # Print to console for debugging
-            QMessageBox.critical(
+            QMessageBox.warning(
                 self,
-                "Error Generating PDF",
-                error_msg
+                "Warning",
+                f"PDF was generated but could not be opened automatically:\n{str(e)}"
             )
-
+            
+    def on_pdf_failed(self, error):
+        """Report a failed PDF generation"""
+        self.on_pdf_done()
+        if error:
+            error_msg = f"An error occurred while generating the PDF:\n{error}"
+        else:
+            error_msg = "Failed to generate PDF. Please try again."
+        QMessageBox.critical(self, "Error Generating PDF", error_msg)
 
 
 def main():
@@ -1965,26 +1652,7 @@ def main():
     app.setApplicationVersion("2.2")
     
     # Set application style
-    app.setStyleSheet("""
-        QMainWindow {
-            background-color: #ffffff;
-        }
-        QLabel {
-            color: #2c3e50;
-        }
-        QGroupBox {
-            font-weight: bold;
-            border: 2px solid #bdc3c7;
-            border-radius: 5px;
-            margin-top: 10px;
-            padding-top: 10px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-        }
-    """)
+    apply_app_style(app)
     
     # Create and show main window
     window = MagnusClientIntakeForm()
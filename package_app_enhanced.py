@@ -7,6 +7,8 @@ Creates all necessary files for building a Windows installer with enhanced featu
 import os
 import sys
 import platform
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # Define paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -15,21 +17,68 @@ LICENSE_PATH = os.path.join(SCRIPT_DIR, "LICENSE.txt")
 HOOK_PATH = os.path.join(SCRIPT_DIR, "hook.py")
 BATCH_FILE_PATH = os.path.join(SCRIPT_DIR, "build_installer.bat")
 REQUIREMENTS_PATH = os.path.join(SCRIPT_DIR, "requirements.txt")
+SPEC_PATH = os.path.join(SCRIPT_DIR, "magnus_form_enhanced.spec")
+NSI_PATH = os.path.join(SCRIPT_DIR, "installer_enhanced.nsi")
+README_PATH = os.path.join(SCRIPT_DIR, "README.md")
+
+
+LINE_SEPARATOR = os.linesep.encode("ascii")
+
+
+def file_bytes(content):
+    """Convert a bytes template to the platform's line endings"""
+    if LINE_SEPARATOR == b"\n":
+        return content
+    return content.replace(b"\n", LINE_SEPARATOR)
+
+
+def write_file(path, data, exclusive=False):
+    """Write a generated file with one unbuffered write; exclusive refuses to replace an existing file"""
+    mode = os.O_EXCL if exclusive else os.O_TRUNC
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | mode | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        # No fsync: these files are regenerated on every run, so write-back is left to the OS
+        os.close(fd)
+
+
+def write_if_changed(path, content):
+    """Write a generated file unless it already holds this content; return True if written"""
+    data = file_bytes(content)
+    try:
+        # A size mismatch is enough to know the file is stale without reading it
+        if os.stat(path).st_size == len(data) and Path(path).read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    write_file(path, data)
+    return True
+
+
+# Feature list shared by the LICENSE, the batch file and the closing summary
+FEATURES = (
+    "Advanced form validation with real-time feedback",
+    "Auto-save functionality and draft management",
+    "Data encryption for sensitive information",
+    "Accessibility features and keyboard navigation",
+    "Professional PDF generation",
+)
+license_feature_block = "".join(f"- {feature}\n" for feature in FEATURES).encode("ascii")
+batch_feature_block = "".join(f"echo - {feature}\n" for feature in FEATURES).encode("ascii")
 
 # Create requirements.txt with all dependencies
-requirements_content = """PyQt6>=6.4.0
+requirements_content = b"""PyQt6>=6.4.0
 reportlab>=3.6.0
+python-docx>=0.8.11
 cryptography>=3.4.8
+orjson>=3.8.0
 """
 
-with open(REQUIREMENTS_PATH, "w") as f:
-    f.write(requirements_content)
-print(f"Created requirements.txt at {REQUIREMENTS_PATH}")
-
-# Create LICENSE.txt if it doesn't exist
-if not os.path.exists(LICENSE_PATH):
-    with open(LICENSE_PATH, "w") as f:
-        f.write("""Magnus Client Intake Form Application License - Enhanced Version
+# LICENSE.txt, only created if it doesn't exist
+license_content = b"""Magnus Client Intake Form Application License - Enhanced Version
 
 Copyright (c) 2025 Magnus
 
@@ -52,18 +101,10 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 
 ENHANCED FEATURES:
-- Advanced form validation with real-time feedback
-- Auto-save functionality and draft management
-- Data encryption for sensitive information
-- Accessibility features and keyboard navigation
-- Professional PDF generation with comprehensive formatting
-""")
-    print(f"Created LICENSE.txt at {LICENSE_PATH}")
-
-# Create enhanced hook.py
-if not os.path.exists(HOOK_PATH):
-    with open(HOOK_PATH, "w") as f:
-        f.write("""import os
+""" + license_feature_block
+
+# Enhanced hook.py, only created if it doesn't exist
+hook_content = b"""import os
 import sys
 
 # Ensure PyQt6 can find its dependencies
@@ -73,13 +114,38 @@ if hasattr(sys, '_MEIPASS'):
     
     # Add cryptography support
     os.environ['CRYPTOGRAPHY_DONT_BUILD_RUST'] = '1'
-""")
-    print(f"Created hook.py at {HOOK_PATH}")
+"""
 
 # Create enhanced PyInstaller spec file
-spec_content = """# -*- mode: python ; coding: utf-8 -*-
+spec_content = b"""# -*- mode: python ; coding: utf-8 -*-
+
+import os
 
-block_cipher = None
+# Qt assets the app never loads; every byte bundled is extracted again at start-up
+QT_EXCLUDED_DATAS = ('translations', 'qml', 'qtwebengine')
+QT_EXCLUDED_BINARIES = ('qt6webengine', 'qt6quick', 'qt6qml', 'qt6pdf')
+# Plugins are collected as binaries, so these are matched against both lists
+QT_EXCLUDED_PLUGINS = ('imageformats/qgif', 'imageformats/qtiff')
+
+
+# Lower-case destination path of a TOC entry, with forward slashes
+def toc_path(entry):
+    return entry[0].lower().replace('\\\\', '/')
+
+# Always-loaded DLLs gain little from UPX and would be unpacked on every launch
+UPX_EXCLUDE = [
+    'python3*.dll',
+    'Qt6Core.dll',
+    'Qt6Gui.dll',
+    'Qt6Widgets.dll',
+    'vcruntime*.dll',
+    'msvcp*.dll',
+    'libcrypto*.dll',
+    'libssl*.dll'
+]
+
+# MAGNUS_ONEDIR=1 builds a folder instead of a single EXE, skipping the per-launch extraction
+ONEDIR = os.environ.get('MAGNUS_ONEDIR') == '1'
 
 a = Analysis(
     ['main_enhanced.py'],
@@ -90,15 +156,11 @@ a = Analysis(
         ('pdf_generator_reportlab.py', '.'),
         ('validation.py', '.'),
         ('security.py', '.'),
+        ('form_fields.py', '.'),
+        ('styles.qss', '.'),
         ('requirements.txt', '.')
     ],
     hiddenimports=[
-        'PyQt6', 
-        'PyQt6.QtWidgets', 
-        'PyQt6.QtCore', 
-        'PyQt6.QtGui',
-        'reportlab.graphics.barcode', 
-        'reportlab.graphics.barcode.code128', 
         'reportlab.lib.pagesizes',
         'reportlab.platypus',
         'reportlab.lib.styles',
@@ -110,28 +172,61 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=['hook.py'],
-    excludes=[],
+    excludes=[
+        'tkinter',
+        'unittest',
+        'test',
+        'pydoc',
+        'pydoc_data',
+        'distutils',
+        'setuptools',
+        'pip',
+        'PyQt6.QtNetwork',
+        'PyQt6.QtMultimedia',
+        'PyQt6.QtQml',
+        'PyQt6.QtQuick',
+        'PyQt6.QtWebEngineCore',
+        'PyQt6.QtWebEngineWidgets',
+        'PyQt6.QtPdf',
+        'PyQt6.QtSql',
+        'PyQt6.QtTest',
+        'PyQt6.QtDBus',
+        'PyQt6.QtBluetooth',
+        'PyQt6.QtPositioning',
+        'PyQt6.QtSerialPort'
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
-    cipher=block_cipher,
     noarchive=False,
+    optimize=2,
 )
 
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+a.datas = [
+    entry for entry in a.datas
+    if not any(name in toc_path(entry) for name in QT_EXCLUDED_DATAS + QT_EXCLUDED_PLUGINS)
+]
+a.binaries = [
+    entry for entry in a.binaries
+    if not os.path.basename(toc_path(entry)).startswith(QT_EXCLUDED_BINARIES)
+    and not any(name in toc_path(entry) for name in QT_EXCLUDED_PLUGINS)
+]
+
+pyz = PYZ(a.pure, a.zipped_data)
+
+bundled = [] if ONEDIR else [a.binaries, a.zipfiles, a.datas]
 
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
+    *bundled,
     [],
+    exclude_binaries=ONEDIR,
     name='MagnusClientIntakeForm_Enhanced',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
+    upx_exclude=UPX_EXCLUDE,
     runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
@@ -148,19 +243,32 @@ exe = EXE(
         'copyright': 'Copyright (c) 2025 Magnus'
     }
 )
-"""
 
-with open(os.path.join(SCRIPT_DIR, "magnus_form_enhanced.spec"), "w") as f:
-    f.write(spec_content)
-    print(f"Created PyInstaller spec file at {os.path.join(SCRIPT_DIR, 'magnus_form_enhanced.spec')}")
+if ONEDIR:
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        strip=False,
+        upx=True,
+        upx_exclude=UPX_EXCLUDE,
+        name='MagnusClientIntakeForm_Enhanced'
+    )
+"""
 
 # Create enhanced NSIS installer script
-nsis_content = """
+nsis_content = b"""
 ; Magnus Client Intake Form Enhanced Installer Script
 ; Created with NSIS
 
 !include "MUI2.nsh"
 
+; Compression: one solid LZMA stream decompresses sequentially at install time
+SetCompressor /SOLID lzma
+SetCompressorDictSize 64
+SetDatablockOptimize on
+
 ; Application information
 Name "Magnus Client Intake Form Enhanced"
 OutFile "MagnusClientIntakeForm_Enhanced_Setup.exe"
@@ -262,24 +370,30 @@ Section "Uninstall"
 SectionEnd
 """
 
-with open(os.path.join(SCRIPT_DIR, "installer_enhanced.nsi"), "w") as f:
-    f.write(nsis_content)
-    print(f"Created NSIS installer script at {os.path.join(SCRIPT_DIR, 'installer_enhanced.nsi')}")
-
 # Create enhanced batch file for building the installer
-batch_content = """@echo off
+batch_content = b"""@echo off
 echo Starting Magnus Client Intake Form Enhanced installer build process...
 
-echo Creating virtual environment...
-python -m venv venv
+if not exist venv\\Scripts\\python.exe (
+    echo Creating virtual environment...
+    python -m venv venv
+)
 call venv\\Scripts\\activate.bat
 
-echo Installing required packages...
-pip install -r requirements.txt
-pip install pyinstaller
+rem Reinstall only when requirements.txt differs from the copy stored after the last install
+fc /b requirements.txt venv\\requirements.installed >nul 2>&1
+if errorlevel 1 (
+    echo Installing required packages...
+    set PIP_DISABLE_PIP_VERSION_CHECK=1
+    pip install --prefer-binary --only-binary=:all: -r requirements.txt pyinstaller && copy /y requirements.txt venv\\requirements.installed >nul
+) else (
+    echo Required packages are up to date.
+)
 
 echo Building executable with PyInstaller...
-pyinstaller magnus_form_enhanced.spec
+set PYTHONHASHSEED=0
+set PYINSTALLER_CONFIG_DIR=%CD%\\.pyinstaller-cache
+pyinstaller --noconfirm --log-level=WARN magnus_form_enhanced.spec
 
 echo Creating installer with NSIS...
 "C:\\Program Files (x86)\\NSIS\\makensis.exe" installer_enhanced.nsi
@@ -288,26 +402,17 @@ echo Build process completed.
 echo The installer should be available as MagnusClientIntakeForm_Enhanced_Setup.exe
 echo.
 echo Enhanced Features Included:
-echo - Advanced form validation with real-time feedback
-echo - Auto-save functionality and draft management  
-echo - Data encryption for sensitive information
-echo - Accessibility features and keyboard navigation
-echo - Professional PDF generation
-echo.
+""" + batch_feature_block + b"""echo.
 pause
 """
 
-with open(BATCH_FILE_PATH, "w") as f:
-    f.write(batch_content)
-    print(f"Created batch file at {BATCH_FILE_PATH}")
-
 # Create a simple icon file if it doesn't exist
 if not os.path.exists(ICON_PATH):
     print(f"Note: Please add an icon file named 'icon.ico' to {SCRIPT_DIR}")
     print("You can create one online or use any .ico file for the application icon.")
 
 # Create README for the enhanced version
-readme_content = """# Magnus Client Intake Form - Enhanced Version 2.0
+readme_content = b"""# Magnus Client Intake Form - Enhanced Version 2.0
 
 ## Overview
 This is an enhanced version of the Magnus Client Intake Form application with advanced features including validation, security, and accessibility improvements.
@@ -368,17 +473,40 @@ For technical support or questions, please contact the Magnus development team.
 - v1.0: Original basic version
 """
 
-with open(os.path.join(SCRIPT_DIR, "README.md"), "w") as f:
-    f.write(readme_content)
-    print(f"Created README.md at {os.path.join(SCRIPT_DIR, 'README.md')}")
+# Stage every file, then write them in one tight pass: path -> (description, content)
+SEED_FILES = {
+    LICENSE_PATH: ("LICENSE.txt", license_content),
+    HOOK_PATH: ("hook.py", hook_content),
+}
+GENERATED_FILES = {
+    REQUIREMENTS_PATH: ("requirements.txt", requirements_content),
+    SPEC_PATH: ("PyInstaller spec file", spec_content),
+    NSI_PATH: ("NSIS installer script", nsis_content),
+    BATCH_FILE_PATH: ("batch file", batch_content),
+    README_PATH: ("README.md", readme_content),
+}
+
+# Seed files are left alone once they exist so local edits survive
+for path, (description, content) in SEED_FILES.items():
+    try:
+        write_file(path, file_bytes(content), exclusive=True)
+    except FileExistsError:
+        continue
+    print(f"Created {description} at {path}")
+
+# The files are independent, so overlap their writes and report in a fixed order
+with ThreadPoolExecutor(max_workers=4) as executor:
+    written = executor.map(write_if_changed, GENERATED_FILES, (content for _, content in GENERATED_FILES.values()))
+    for (path, (description, _)), was_written in zip(GENERATED_FILES.items(), written):
+        if was_written:
+            print(f"Created {description} at {path}")
+        else:
+            print(f"{description} is up to date at {path}")
 
 print("\nAll enhanced packaging files have been created successfully!")
 print("\nEnhanced Features Included:")
-print("✓ Advanced form validation with real-time feedback")
-print("✓ Auto-save functionality and draft management")
-print("✓ Data encryption for sensitive information")
-print("✓ Accessibility features and keyboard navigation")
-print("✓ Professional PDF generation")
+for feature in FEATURES:
+    print(f"✓ {feature}")
 print("\nTo build the enhanced installer:")
 print("1. Make sure you have an icon file named 'icon.ico' in the same directory")
 print("2. Run the batch file 'build_installer.bat'")
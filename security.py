@@ -11,15 +11,34 @@ import hashlib
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 import base64
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard json module
+
+# Marks values encrypted with AES-GCM; older drafts hold Fernet tokens
+AESGCM_PREFIX = "gcm:"
+AESGCM_NONCE_SIZE = 12
+
 class DataSecurity:
     """Handles data encryption and secure operations"""
     
     def __init__(self, password=None):
         self.password = password or "magnus_default_key_2024"
         self.key = self._derive_key(self.password)
-        self.cipher = Fernet(self.key)
+        self.aead = AESGCM(self._derive_aead_key(self.key))
+        self._legacy_cipher = None
+    
+    @property
+    def cipher(self):
+        """Fernet cipher, only needed to read drafts saved by older versions"""
+        if self._legacy_cipher is None:
+            self._legacy_cipher = Fernet(self.key)
+        return self._legacy_cipher
     
     def _derive_key(self, password: str) -> bytes:
         """Derive encryption key from password"""
@@ -34,11 +53,22 @@ class DataSecurity:
         key = base64.urlsafe_b64encode(kdf.derive(password_bytes))
         return key
     
+    def _derive_aead_key(self, key: bytes) -> bytes:
+        """Derive a separate AES-GCM key so the Fernet key is not reused across algorithms"""
+        hkdf = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b'aesgcm',
+        )
+        return hkdf.derive(base64.urlsafe_b64decode(key))
+    
     def encrypt_data(self, data: str) -> str:
         """Encrypt string data"""
         try:
-            encrypted_data = self.cipher.encrypt(data.encode())
-            return base64.urlsafe_b64encode(encrypted_data).decode()
+            nonce = os.urandom(AESGCM_NONCE_SIZE)
+            encrypted_data = nonce + self.aead.encrypt(nonce, data.encode(), None)
+            return AESGCM_PREFIX + base64.urlsafe_b64encode(encrypted_data).decode()
         except Exception as e:
             print(f"Encryption error: {e}")
             return data  # Return original data if encryption fails
@@ -46,8 +76,13 @@ class DataSecurity:
     def decrypt_data(self, encrypted_data: str) -> str:
         """Decrypt string data"""
         try:
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode())
-            decrypted_data = self.cipher.decrypt(encrypted_bytes)
+            if encrypted_data.startswith(AESGCM_PREFIX):
+                encrypted_bytes = base64.urlsafe_b64decode(encrypted_data[len(AESGCM_PREFIX):].encode())
+                nonce = encrypted_bytes[:AESGCM_NONCE_SIZE]
+                decrypted_data = self.aead.decrypt(nonce, encrypted_bytes[AESGCM_NONCE_SIZE:], None)
+            else:
+                encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode())
+                decrypted_data = self.cipher.decrypt(encrypted_bytes)
             return decrypted_data.decode()
         except Exception as e:
             print(f"Decryption error: {e}")
@@ -84,12 +119,17 @@ class DataSecurity:
             # Encrypt sensitive fields
             encrypted_data = self.encrypt_sensitive_fields(data)
             
-            # Create secure temporary file
-            temp_fd, temp_path = tempfile.mkstemp(suffix='.tmp', prefix='magnus_')
+            # Create secure temporary file next to the target so the final move is atomic
+            temp_fd, temp_path = tempfile.mkstemp(
+                suffix='.tmp', prefix='magnus_', dir=os.path.dirname(os.path.abspath(file_path))
+            )
             
             try:
-                with os.fdopen(temp_fd, 'w') as temp_file:
-                    json.dump(encrypted_data, temp_file, indent=2)
+                with os.fdopen(temp_fd, 'wb') as temp_file:
+                    if orjson is not None:
+                        temp_file.write(orjson.dumps(encrypted_data, option=orjson.OPT_INDENT_2))
+                    else:
+                        temp_file.write(json.dumps(encrypted_data, indent=2).encode('utf-8'))
                 
                 # Move temp file to final location
                 os.replace(temp_path, file_path)
@@ -114,8 +154,9 @@ class DataSecurity:
     def secure_load_data(self, file_path: str) -> dict:
         """Securely load and decrypt data from file"""
         try:
-            with open(file_path, 'r') as f:
-                encrypted_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            encrypted_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             # Decrypt sensitive fields
             decrypted_data = self.decrypt_sensitive_fields(encrypted_data)
@@ -8,6 +8,42 @@ import re
 from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime, date
 
+# Patterns are compiled once at import and shared by every validation call
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+NON_DIGIT_PATTERN = re.compile(r'[^\d]')
+NON_NUMERIC_PATTERN = re.compile(r'[^\d.]')
+
+# Lookup tables are built once; set membership avoids rebuilding and scanning lists per call
+INVALID_SSNS = frozenset([
+    '000000000', '111111111', '222222222', '333333333',
+    '444444444', '555555555', '666666666', '777777777',
+    '888888888', '999999999', '123456789'
+])
+VALID_TAX_BRACKETS = frozenset([
+    "0-15%", "15%-32%", "32%+",
+    "Not sure", "Prefer not to answer"
+])
+VALID_EDUCATION_LEVELS = frozenset([
+    "High School", "Some College", "Associate Degree",
+    "Bachelor's Degree", "Master's Degree", "Doctoral Degree",
+    "Professional Degree", "Other", "Prefer not to answer"
+])
+VALID_RISK_LEVELS = frozenset([
+    "Conservative", "Moderate", "Moderate Aggressive", "Aggressive"
+])
+VALID_INVESTMENT_OBJECTIVES = frozenset([
+    "Income", "Growth and Income", "Capital Appreciation", "Speculation"
+])
+
+
+def strip_non_digits(text: str) -> str:
+    """Return only the digits of text, skipping the regex when it is already all digits"""
+    # isdigit() alone also accepts characters such as '²' that the regex removes
+    if text.isascii() and text.isdigit():
+        return text
+    return NON_DIGIT_PATTERN.sub('', text)
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
@@ -78,8 +114,7 @@ class FormValidator:
         if not email:
             return True  # Allow empty emails unless required
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, email):
+        if not EMAIL_PATTERN.match(email):
             self.add_error(field_name, "Please enter a valid email address")
             return False
         return True
@@ -90,20 +125,14 @@ class FormValidator:
             return True  # Allow empty unless required
         
         # Remove any formatting
-        clean_ssn = re.sub(r'[^\d]', '', ssn)
+        clean_ssn = strip_non_digits(ssn)
         
         if len(clean_ssn) != 9:
             self.add_error(field_name, "SSN must be 9 digits")
             return False
         
         # Check for invalid patterns
-        invalid_patterns = [
-            '000000000', '111111111', '222222222', '333333333',
-            '444444444', '555555555', '666666666', '777777777',
-            '888888888', '999999999', '123456789'
-        ]
-        
-        if clean_ssn in invalid_patterns:
+        if clean_ssn in INVALID_SSNS:
             self.add_error(field_name, "Please enter a valid SSN")
             return False
         
@@ -115,7 +144,7 @@ class FormValidator:
             return True  # Allow empty unless required
         
         # Remove formatting
-        clean_phone = re.sub(r'[^\d]', '', phone)
+        clean_phone = strip_non_digits(phone)
         
         if len(clean_phone) != 10:
             self.add_error(field_name, "Phone number must be 10 digits")
@@ -315,7 +344,7 @@ class FormValidator:
             return True  # Allow empty unless required
         
         # Remove formatting (commas, dollar signs)
-        clean_income = re.sub(r'[^\d.]', '', income)
+        clean_income = NON_NUMERIC_PATTERN.sub('', income)
         
         try:
             income_value = float(clean_income)
@@ -335,12 +364,7 @@ class FormValidator:
         if not bracket:
             return True  # Allow empty unless required
         
-        valid_brackets = [
-            "0-15%", "15%-32%", "32%+", 
-            "Not sure", "Prefer not to answer"
-        ]
-        
-        if bracket not in valid_brackets:
+        if bracket not in VALID_TAX_BRACKETS:
             self.add_error(field_name, "Please select a valid tax bracket")
             return False
         
@@ -351,13 +375,7 @@ class FormValidator:
         if not education:
             return True  # Allow empty unless required
         
-        valid_education = [
-            "High School", "Some College", "Associate Degree", 
-            "Bachelor's Degree", "Master's Degree", "Doctoral Degree",
-            "Professional Degree", "Other", "Prefer not to answer"
-        ]
-        
-        if education not in valid_education:
+        if education not in VALID_EDUCATION_LEVELS:
             self.add_error(field_name, "Please select a valid education level")
             return False
         
@@ -368,11 +386,7 @@ class FormValidator:
         if not risk_tolerance:
             return True  # Allow empty unless required
         
-        valid_risk_levels = [
-            "Conservative", "Moderate", "Moderate Aggressive", "Aggressive"
-        ]
-        
-        if risk_tolerance not in valid_risk_levels:
+        if risk_tolerance not in VALID_RISK_LEVELS:
             self.add_error(field_name, "Please select a valid risk tolerance level")
             return False
         
@@ -383,11 +397,7 @@ class FormValidator:
         if not objectives:
             return True  # Allow empty unless required
         
-        valid_objectives = [
-            "Income", "Growth and Income", "Capital Appreciation", "Speculation"
-        ]
-        
-        if objectives not in valid_objectives:
+        if objectives not in VALID_INVESTMENT_OBJECTIVES:
             self.add_error(field_name, "Please select a valid investment objective")
             return False
         
@@ -449,7 +459,6 @@ class FormValidator:
         asset_experience = data.get("expanded_asset_experience", {})
         
         for asset in asset_types:
-            asset_key = asset.lower().replace("/", "_").replace(" ", "_")
             experience_data = asset_experience.get(asset, {})
             
             # Validate year started if provided